@@ -460,17 +460,16 @@ void Tableau::loadStabilizerDestabilizerString(const std::string& string) {
   };
 
   const char  delimiter = ',';
-  std::string stab;
+  std::size_t start     = 0U;
   for (std::size_t pos = stabilizers.find(delimiter); pos != std::string::npos;
-       pos             = stabilizers.find(delimiter)) {
-    stab            = stabilizers.substr(0, pos);
-    const auto& row = parseStabilizer(stab);
+       pos             = stabilizers.find(delimiter, start)) {
+    const auto& row = parseStabilizer(stabilizers.substr(start, pos - start));
     checkStabLength(row);
     tableau.push_back(row);
-    stabilizers = stabilizers.substr(pos + 1);
+    start = pos + 1;
   }
-  const auto& row =
-      parseStabilizer(stabilizers); // parse stabilizer past last comma
+  const auto& row = parseStabilizer(
+      stabilizers.substr(start)); // parse stabilizer past last comma
   checkStabLength(row);
   tableau.push_back(row);
 }
@@ -6,48 +6,102 @@ See README.md or go to https://github.com/cda-tum/qmap for more information.
 
 from __future__ import annotations
 
-import os
-import sys
-from pathlib import Path
-
-if sys.platform == "win32" and sys.version_info > (3, 8, 0) and "Z3_ROOT" in os.environ:
-    lib_path = Path(os.environ["Z3_ROOT"]) / "lib"
-    if lib_path.exists():
-        os.add_dll_directory(str(lib_path))
-    bin_path = Path(os.environ["Z3_ROOT"]) / "bin"
-    if bin_path.exists():
-        os.add_dll_directory(str(bin_path))
+import importlib
+from typing import TYPE_CHECKING
 
 from ._version import version as __version__
-from .clifford_synthesis import optimize_clifford, synthesize_clifford
-from .compile import compile
-from .pyqmap import (
-    Arch,
-    Architecture,
-    CliffordSynthesizer,
-    CommanderGrouping,
-    Configuration,
-    Encoding,
-    Heuristic,
-    HybridMapperParameters,
-    HybridNAMapper,
-    InitialCircuitMapping,
-    InitialCoordinateMapping,
-    InitialLayout,
-    Layering,
-    LookaheadHeuristic,
-    MappingResults,
-    Method,
-    NeutralAtomHybridArchitecture,
-    QuantumComputation,
-    SwapReduction,
-    SynthesisConfiguration,
-    SynthesisResults,
-    Tableau,
-    TargetMetric,
-    Verbosity,
-)
-from .subarchitectures import SubarchitectureOrder
+from ._z3_dll import ensure_z3_dll
+
+# a Z3 installation given by Z3_ROOT has to be registered before the extension is loaded,
+# which includes importing mqt.qmap.pyqmap directly (registering it is cheap and does not load the extension)
+ensure_z3_dll()
+
+if TYPE_CHECKING:
+    from .clifford_synthesis import (
+        CliffordSynthesizer,
+        SynthesisConfiguration,
+        SynthesisResults,
+        Tableau,
+        TargetMetric,
+        optimize_clifford,
+        synthesize_clifford,
+    )
+    from .compile import compile
+    from .pyqmap import (
+        Arch,
+        Architecture,
+        CommanderGrouping,
+        Configuration,
+        Encoding,
+        Heuristic,
+        HybridMapperParameters,
+        HybridNAMapper,
+        InitialCircuitMapping,
+        InitialCoordinateMapping,
+        InitialLayout,
+        Layering,
+        LookaheadHeuristic,
+        MappingResults,
+        Method,
+        NeutralAtomHybridArchitecture,
+        QuantumComputation,
+        SwapReduction,
+        Verbosity,
+    )
+    from .subarchitectures import SubarchitectureOrder
+
+#: Submodule providing each of the lazily imported attributes of the package.
+#: The (Z3-backed) Clifford synthesis types are resolved through :mod:`.clifford_synthesis`, so that workflows that
+#: only enumerate subarchitectures do not load the compiled extension.
+_LAZY = {
+    "Arch": "pyqmap",
+    "Architecture": "pyqmap",
+    "CliffordSynthesizer": "clifford_synthesis",
+    "CommanderGrouping": "pyqmap",
+    "Configuration": "pyqmap",
+    "Encoding": "pyqmap",
+    "Heuristic": "pyqmap",
+    "HybridMapperParameters": "pyqmap",
+    "HybridNAMapper": "pyqmap",
+    "InitialCircuitMapping": "pyqmap",
+    "InitialCoordinateMapping": "pyqmap",
+    "InitialLayout": "pyqmap",
+    "Layering": "pyqmap",
+    "LookaheadHeuristic": "pyqmap",
+    "MappingResults": "pyqmap",
+    "Method": "pyqmap",
+    "NeutralAtomHybridArchitecture": "pyqmap",
+    "QuantumComputation": "pyqmap",
+    "SwapReduction": "pyqmap",
+    "SynthesisConfiguration": "clifford_synthesis",
+    "SynthesisResults": "clifford_synthesis",
+    "Tableau": "clifford_synthesis",
+    "TargetMetric": "clifford_synthesis",
+    "Verbosity": "pyqmap",
+    "SubarchitectureOrder": "subarchitectures",
+    "compile": "compile",
+    "optimize_clifford": "clifford_synthesis",
+    "synthesize_clifford": "clifford_synthesis",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the public attributes of the package on first access.
+
+    This way, importing the package neither loads the compiled extension nor Qiskit until they are needed.
+    """
+    if name not in _LAZY:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the ones that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "Arch",
@@ -0,0 +1,22 @@
+"""Make a Z3 installation given by ``Z3_ROOT`` available to the compiled extension on Windows.
+
+The extension links against Z3 (for the exact mapper and the Clifford synthesizer).
+Hence, :func:`ensure_z3_dll` is called by the package's ``__init__`` before :mod:`mqt.qmap.pyqmap` can be loaded.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=None)
+def ensure_z3_dll() -> None:
+    """Add the library directories of the Z3 installation given by ``Z3_ROOT`` to the DLL search path (once)."""
+    if sys.platform == "win32" and "Z3_ROOT" in os.environ:
+        for subdir in ("lib", "bin"):
+            path = Path(os.environ["Z3_ROOT"]) / subdir
+            if path.exists():
+                os.add_dll_directory(str(path))
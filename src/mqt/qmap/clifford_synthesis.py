@@ -2,86 +2,120 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
-from qiskit import QuantumCircuit, qasm3
-from qiskit.quantum_info import Clifford, PauliList
-from qiskit.transpiler.layout import TranspileLayout
-
-from .compile import extract_initial_layout_from_qasm
 from .pyqmap import (
     CliffordSynthesizer,
     QuantumComputation,
     SynthesisConfiguration,
     SynthesisResults,
     Tableau,
+    TargetMetric,
 )
 
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+    from qiskit.quantum_info import Clifford, PauliList
+
 
 def _import_circuit(circuit: str | QuantumCircuit | QuantumComputation) -> QuantumComputation:
     """Import a circuit from a string, a QuantumCircuit, or a QuantumComputation."""
-    if isinstance(circuit, QuantumCircuit):
-        return QuantumComputation.from_qiskit(circuit)
+    if isinstance(circuit, QuantumComputation):
+        return circuit
     if isinstance(circuit, str):
         if circuit.endswith(".qasm"):
             return QuantumComputation.from_file(circuit)
         return QuantumComputation.from_qasm_str(circuit)
-    return circuit
+    return QuantumComputation.from_qiskit(circuit)
 
 
 def _reverse_paulis(paulis: list[str]) -> list[str]:
     return [s[0] + s[:0:-1] if s[0] in "+-" else s[::-1] for s in paulis]
 
 
+#: Tableaus recently imported from Qiskit objects, keyed by the id of the object and whether destabilizers are included.
+#: Each entry holds a copy of the imported object, so that modified objects (or reused ids) are detected.
+_TABLEAU_CACHE: OrderedDict[tuple[int, bool], tuple[Clifford | PauliList, Tableau]] = OrderedDict()
+_TABLEAU_CACHE_SIZE = 8
+
+
 def _import_tableau(tableau: str | Clifford | PauliList | Tableau, include_destabilizers: bool = False) -> Tableau:
-    """Import a tableau from a string, a Clifford, a PauliList, or a Tableau."""
+    """Import a tableau from a string, a Clifford, a PauliList, or a Tableau.
+
+    Tableaus imported from Qiskit objects are cached, so that repeatedly synthesizing the same target (e.g., with
+    different configurations) only converts it once.
+    """
+    if isinstance(tableau, Tableau):
+        return tableau
+    if isinstance(tableau, str):
+        return Tableau(tableau)
+
+    key = (id(tableau), include_destabilizers)
+    cached = _TABLEAU_CACHE.get(key)
+    if cached is not None and _is_same_qiskit_object(cached[0], tableau):
+        _TABLEAU_CACHE.move_to_end(key)
+        return cached[1]
+
+    result = _tableau_from_qiskit(tableau, include_destabilizers)
+    _TABLEAU_CACHE[key] = (tableau.copy(), result)
+    if len(_TABLEAU_CACHE) > _TABLEAU_CACHE_SIZE:
+        _TABLEAU_CACHE.popitem(last=False)
+    return result
+
+
+def _is_same_qiskit_object(cached: Clifford | PauliList, tableau: Clifford | PauliList) -> bool:
+    """Check whether a cached Clifford or PauliList equals the given one.
+
+    The id of a freed object may be reused by an object of a different shape, which Qiskit cannot compare.
+    """
+    from qiskit.quantum_info import PauliList
+
+    if type(cached) is not type(tableau) or cached.num_qubits != tableau.num_qubits:
+        return False
+    if isinstance(tableau, PauliList) and len(cached) != len(tableau):
+        return False
+    return bool(cached == tableau)
+
+
+def _tableau_from_qiskit(tableau: Clifford | PauliList, include_destabilizers: bool) -> Tableau:
+    """Convert a Clifford or a PauliList to a tableau."""
+    # anything passed here is a Qiskit object, which means that Qiskit has already been imported
+    from qiskit.quantum_info import Clifford
+
+    # the labels are passed as a plain comma-separated list, which is cheaper to build and parse than a list's repr
     if isinstance(tableau, Clifford):
         mode = "B" if include_destabilizers else "S"
-        try:
-            return Tableau(str(_reverse_paulis(tableau.to_labels(mode=mode))))
-        except AttributeError:
-            if include_destabilizers:
-                return Tableau(
-                    str(_reverse_paulis(tableau.stabilizer.to_labels())),
-                    str(_reverse_paulis(tableau.destabilizer.to_labels())),
-                )
-            return Tableau(str(_reverse_paulis(tableau.stabilizer.to_labels())))
-    elif isinstance(tableau, PauliList):
-        return Tableau(str(_reverse_paulis(tableau.to_labels())))
-    elif isinstance(tableau, str):
-        return Tableau(tableau)
-    return tableau
+        return Tableau(",".join(_reverse_paulis(tableau.to_labels(mode=mode))))
+    return Tableau(",".join(_reverse_paulis(tableau.to_labels())))
+
+
+#: Names of the options of :class:`SynthesisConfiguration` that can be set via keyword arguments
+_CONFIG_ATTRIBUTES = frozenset(
+    name for name, attr in vars(SynthesisConfiguration).items() if isinstance(attr, property)
+)
 
 
 def _config_from_kwargs(kwargs: dict[str, Any]) -> SynthesisConfiguration:
     """Create a :class:`SynthesisConfiguration` from keyword arguments."""
     config = SynthesisConfiguration()
     for key, value in kwargs.items():
-        if hasattr(config, key):
-            setattr(config, key, value)
-        else:
+        if key not in _CONFIG_ATTRIBUTES:
             msg = f"Invalid keyword argument: {key}"
             raise ValueError(msg)
+        setattr(config, key, value)
 
-    if not config.solver_parameters:
-        config.solver_parameters = {}
-        if config.use_maxsat:
-            config.solver_parameters["pb.compile_equality"] = True
-            config.solver_parameters["maxres.hill_climb"] = True
-            config.solver_parameters["maxres.pivot_on_correction_set"] = False
-        else:
-            config.solver_parameters["bca"] = True
-            config.solver_parameters["restart.emafastglue"] = 0.05
-            config.solver_parameters["restart.emaslowglue"] = 1e-6
-            config.solver_parameters["restart.margin"] = 1.07
-            config.solver_parameters["rephase.base"] = 3000
-            config.solver_parameters["search.sat.conflicts"] = 100
-
+    # unless solver parameters are given explicitly, Z3 runs with its own defaults
     return config
 
 
 def _circuit_from_qasm(qasm: str) -> QuantumCircuit:
     """Create a proper :class:`qiskit.QuantumCircuit` from a QASM string (including layout information)."""
+    from qiskit import qasm3
+    from qiskit.transpiler.layout import TranspileLayout
+
+    from .compile import extract_initial_layout_from_qasm
+
     circ = qasm3.loads(qasm)
     layout = extract_initial_layout_from_qasm(qasm, circ.qregs)
 
@@ -180,3 +214,14 @@ def optimize_clifford(
     circ = _circuit_from_qasm(results.circuit)
 
     return circ, results
+
+
+__all__ = [
+    "CliffordSynthesizer",
+    "SynthesisConfiguration",
+    "SynthesisResults",
+    "Tableau",
+    "TargetMetric",
+    "optimize_clifford",
+    "synthesize_clifford",
+]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from qiskit import QuantumCircuit, QuantumRegister, qasm3
 from qiskit.transpiler import Layout, TranspileLayout
@@ -33,6 +33,8 @@ from .pyqmap import (
     map,
 )
 
+_EnumT = TypeVar("_EnumT")
+
 
 def extract_initial_layout_from_qasm(qasm: str, qregs: list[QuantumRegister]) -> Layout:
     """Extract the initial layout resulting from compiling a circuit from a QASM file.
@@ -44,18 +46,26 @@ def extract_initial_layout_from_qasm(qasm: str, qregs: list[QuantumRegister]) ->
     Returns:
         The initial layout.
     """
-    for line in qasm.split("\n"):
-        if line.startswith("// i "):
-            # strip away initial part of line
-            stripped_line = line[5:]
-            # split line into tokens
-            tokens = stripped_line.split(" ")
-            # convert tokens to integers
-            int_tokens = [int(token) for token in tokens]
-            # create an empty layout
-            return Layout().from_intlist(int_tokens, *qregs)
-    msg = "No initial layout found in QASM file."
-    raise ValueError(msg)
+    # locate the first line starting with the marker without splitting the (potentially large) file into lines
+    if qasm.startswith("// i "):
+        start = 0
+    else:
+        start = qasm.find("\n// i ") + 1
+        if start == 0:
+            msg = "No initial layout found in QASM file."
+            raise ValueError(msg)
+    end = qasm.find("\n", start)
+    # strip away initial part of line
+    stripped_line = qasm[start + 5 : end if end != -1 else None]
+    # split line into tokens and convert them to integers
+    int_tokens = [int(token) for token in stripped_line.split()]
+    # create an empty layout
+    return Layout().from_intlist(int_tokens, *qregs)
+
+
+def _as_enum(value: str | _EnumT, cls: type[_EnumT]) -> _EnumT:
+    """Return the value if it already is a member of the enumeration, otherwise convert it (e.g., from a string)."""
+    return value if isinstance(value, cls) else cls(value)  # type: ignore[call-arg]
 
 
 def compile(  # noqa: A001
@@ -140,25 +150,25 @@ def compile(  # noqa: A001
     load_calibration(architecture, calibration)
 
     config = Configuration()
-    config.method = Method(method)
-    config.heuristic = Heuristic(heuristic)
-    config.initial_layout = InitialLayout(initial_layout)
+    config.method = _as_enum(method, Method)
+    config.heuristic = _as_enum(heuristic, Heuristic)
+    config.initial_layout = _as_enum(initial_layout, InitialLayout)
     if iterative_bidirectional_routing_passes is None:
         config.iterative_bidirectional_routing = False
     else:
         config.iterative_bidirectional_routing = True
         config.iterative_bidirectional_routing_passes = iterative_bidirectional_routing_passes
-    config.layering = Layering(layering)
+    config.layering = _as_enum(layering, Layering)
     if automatic_layer_splits_node_limit is None:
         config.automatic_layer_splits = False
     else:
         config.automatic_layer_splits = True
         config.automatic_layer_splits_node_limit = automatic_layer_splits_node_limit
-    config.early_termination = EarlyTermination(early_termination)
+    config.early_termination = _as_enum(early_termination, EarlyTermination)
     config.early_termination_limit = early_termination_limit
-    config.encoding = Encoding(encoding)
-    config.commander_grouping = CommanderGrouping(commander_grouping)
-    config.swap_reduction = SwapReduction(swap_reduction)
+    config.encoding = _as_enum(encoding, Encoding)
+    config.commander_grouping = _as_enum(commander_grouping, CommanderGrouping)
+    config.swap_reduction = _as_enum(swap_reduction, SwapReduction)
     config.swap_limit = swap_limit
     config.include_WCNF = include_WCNF
     config.use_subsets = use_subsets
@@ -178,7 +188,7 @@ def compile(  # noqa: A001
         config.lookahead_heuristic = LookaheadHeuristic.none
         config.lookaheads = 0
     else:
-        config.lookahead_heuristic = LookaheadHeuristic(lookahead_heuristic)
+        config.lookahead_heuristic = _as_enum(lookahead_heuristic, LookaheadHeuristic)
         config.lookaheads = lookaheads
     config.lookahead_factor = lookahead_factor
 
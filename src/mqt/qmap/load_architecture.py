@@ -2,10 +2,78 @@
 
 from __future__ import annotations
 
-from qiskit.providers import Backend
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from .pyqmap import Arch, Architecture
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from qiskit.providers import Backend
+
+
+@lru_cache(maxsize=128)
+def _resolve_arch_str(arch: str) -> Arch | str:
+    """Return the Arch named by the string or the string itself if it is no Arch (and, hence, a file name)."""
+    try:
+        return Arch(arch)
+    except ValueError:
+        return arch
+
+
+def _from_str(arch: str) -> Architecture:
+    architecture = Architecture()
+    architecture.load_coupling_map(_resolve_arch_str(arch))
+    return architecture
+
+
+def _from_arch(arch: Arch) -> Architecture:
+    architecture = Architecture()
+    architecture.load_coupling_map(arch)
+    return architecture
+
+
+def _from_architecture(arch: Architecture) -> Architecture:
+    return arch
+
+
+@lru_cache(maxsize=None)
+def _get_import_backend() -> Callable[[Backend], Architecture]:
+    """Resolve the Qiskit backend importer once instead of on every call."""
+    from mqt.qmap.qiskit.backend import import_backend
+
+    return import_backend
+
+
+def _from_backend(arch: Backend) -> Architecture:
+    return _get_import_backend()(arch)
+
+
+#: Loaders for the supported architecture types, in the order in which subclasses are resolved.
+#: Qiskit's Backend is only registered once an argument of another type is encountered.
+_LOADERS: dict[type, Callable[[Any], Architecture]] = {
+    str: _from_str,
+    Arch: _from_arch,
+    Architecture: _from_architecture,
+}
+
+
+def _import_qiskit_types() -> dict[str, type]:
+    """Import Qiskit's Backend and register its loader."""
+    from qiskit.providers import Backend
+
+    _LOADERS.setdefault(Backend, _from_backend)
+    return {"Backend": Backend}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import Qiskit's Backend lazily, so loading architectures from strings does not require importing Qiskit."""
+    if name == "Backend":
+        return _import_qiskit_types()[name]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 def load_architecture(arch: str | Arch | Architecture | Backend | None = None) -> Architecture:
     """Load an architecture from a string, Arch, Architecture, or Backend. If None is passed, no architecture is loaded.
@@ -16,24 +84,17 @@ def load_architecture(arch: str | Arch | Architecture | Backend | None = None) -
     Returns:
         The loaded architecture.
     """
-    architecture = Architecture()
+    if arch is None:
+        return Architecture()
 
-    if arch is not None:
-        if isinstance(arch, str):
-            try:
-                architecture.load_coupling_map(Arch(arch))
-            except ValueError:
-                architecture.load_coupling_map(arch)
-        elif isinstance(arch, Arch):
-            architecture.load_coupling_map(arch)
-        elif isinstance(arch, Architecture):
-            architecture = arch
-        elif isinstance(arch, Backend):
-            from mqt.qmap.qiskit.backend import import_backend
-
-            architecture = import_backend(arch)
-        else:  # pragma: no cover
+    loader = _LOADERS.get(type(arch))
+    if loader is None:
+        _import_qiskit_types()
+        # subclasses of the supported types, e.g., concrete backends, are resolved once and then dispatched directly
+        loader = next((loader for cls, loader in _LOADERS.items() if isinstance(arch, cls)), None)
+        if loader is None:  # pragma: no cover
             msg = f"Architecture type {type(arch)} not supported."
             raise TypeError(msg)
+        _LOADERS[type(arch)] = loader
 
-    return architecture
+    return loader(arch)
@@ -2,15 +2,69 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from qiskit.providers.models import BackendProperties
-from qiskit.transpiler.target import Target
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from qiskit.providers.models import BackendProperties
+    from qiskit.transpiler.target import Target
+
     from .pyqmap import Architecture
 
 
+def _from_str(architecture: Architecture, calibration: str) -> None:
+    architecture.load_properties(calibration)
+
+
+@lru_cache(maxsize=None)
+def _get_import_backend_properties() -> Callable[[BackendProperties], Architecture.Properties]:
+    """Resolve the Qiskit backend properties importer once instead of on every call."""
+    from mqt.qmap.qiskit.backend import import_backend_properties
+
+    return import_backend_properties
+
+
+@lru_cache(maxsize=None)
+def _get_import_target() -> Callable[[Target], Architecture.Properties]:
+    """Resolve the Qiskit target importer once instead of on every call."""
+    from mqt.qmap.qiskit.backend import import_target
+
+    return import_target
+
+
+def _from_backend_properties(architecture: Architecture, calibration: BackendProperties) -> None:
+    architecture.load_properties(_get_import_backend_properties()(calibration))
+
+
+def _from_target(architecture: Architecture, calibration: Target) -> None:
+    architecture.load_properties(_get_import_target()(calibration))
+
+
+#: Loaders for the supported calibration types, in the order in which subclasses are resolved.
+#: Qiskit's types are only registered once a calibration that is not a string is encountered.
+_LOADERS: dict[type, Callable[[Architecture, Any], None]] = {str: _from_str}
+
+
+def _import_qiskit_types() -> dict[str, type]:
+    """Import Qiskit's BackendProperties and Target and register their loaders."""
+    from qiskit.providers.models import BackendProperties
+    from qiskit.transpiler.target import Target
+
+    _LOADERS.setdefault(BackendProperties, _from_backend_properties)
+    _LOADERS.setdefault(Target, _from_target)
+    return {"BackendProperties": BackendProperties, "Target": Target}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import Qiskit's types lazily, so loading calibrations from files does not require importing Qiskit."""
+    if name in {"BackendProperties", "Target"}:
+        return _import_qiskit_types()[name]
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
 def load_calibration(architecture: Architecture, calibration: str | Target | BackendProperties | None = None) -> None:
     """Load a calibration from a string, BackendProperties, or Target.
 
@@ -21,16 +75,14 @@ def load_calibration(architecture: Architecture, calibration: str | Target | Bac
     if calibration is None:
         return
 
-    if isinstance(calibration, str):
-        architecture.load_properties(calibration)
-    elif isinstance(calibration, BackendProperties):
-        from mqt.qmap.qiskit.backend import import_backend_properties
-
-        architecture.load_properties(import_backend_properties(calibration))
-    elif isinstance(calibration, Target):
-        from mqt.qmap.qiskit.backend import import_target
+    loader = _LOADERS.get(type(calibration))
+    if loader is None:
+        _import_qiskit_types()
+        # subclasses of the supported types are resolved once and then dispatched directly
+        loader = next((loader for cls, loader in _LOADERS.items() if isinstance(calibration, cls)), None)
+        if loader is None:  # pragma: no cover
+            msg = f"Calibration type {type(calibration)} not supported."
+            raise TypeError(msg)
+        _LOADERS[type(calibration)] = loader
 
-        architecture.load_properties(import_target(calibration))
-    else:  # pragma: no cover
-        msg = f"Calibration type {type(calibration)} not supported."
-        raise TypeError(msg)
+    loader(architecture, calibration)
@@ -74,25 +74,29 @@ def import_target(target: Target) -> Architecture.Properties:
         The imported target as an Architecture.Properties object.
     """
     props = Architecture.Properties()
-    props.num_qubits = len(target.qubit_properties)
+    qubit_properties = target.qubit_properties
+    props.num_qubits = len(qubit_properties)
 
-    for i in range(props.num_qubits):
-        qubit_props = target.qubit_properties[i]
+    for i, qubit_props in enumerate(qubit_properties):
         props.set_t1(i, qubit_props.t1)
         props.set_t2(i, qubit_props.t2)
         props.set_frequency(i, qubit_props.frequency)
 
-    for instruction, qargs in target.instructions:
-        if instruction.name in {"reset", "delay"}:
+    # iterate the properties of each instruction directly instead of looking them up for every entry
+    set_readout_error = props.set_readout_error
+    set_single_qubit_error = props.set_single_qubit_error
+    set_two_qubit_error = props.set_two_qubit_error
+    for name, instruction_props_by_qargs in target.items():
+        if name in {"reset", "delay"}:
             continue
 
-        instruction_props = target[instruction.name][qargs]
-        if instruction.name == "measure":
-            props.set_readout_error(qargs[0], instruction_props.error)
-        elif len(qargs) == 1:
-            props.set_single_qubit_error(qargs[0], instruction.name, instruction_props.error)
-        elif len(qargs) == 2:
-            props.set_two_qubit_error(qargs[0], qargs[1], instruction_props.error, instruction.name)
+        for qargs, instruction_props in instruction_props_by_qargs.items():
+            if name == "measure":
+                set_readout_error(qargs[0], instruction_props.error)
+            elif len(qargs) == 1:
+                set_single_qubit_error(qargs[0], name, instruction_props.error)
+            elif len(qargs) == 2:
+                set_two_qubit_error(qargs[0], qargs[1], instruction_props.error, name)
 
     return props
 
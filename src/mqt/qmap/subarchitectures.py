@@ -5,20 +5,20 @@ This file implements the methods presented in https://arxiv.org/abs/2210.09321.
 
 from __future__ import annotations
 
+import hashlib
+import os
 import pickle
 import sys
-from itertools import combinations
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, NewType, Optional, Set, Tuple
-
-if TYPE_CHECKING or sys.version_info < (3, 10, 0):
-    import importlib_resources as resources
-else:
-    from importlib import resources
+from typing import TYPE_CHECKING, Any, Dict, NewType, Optional, Set, Tuple
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
 
+    import numpy.typing as npt
     from matplotlib import figure
     from qiskit.providers import BackendV1, BackendV2
     from typing_extensions import TypeAlias
@@ -27,8 +27,8 @@ if TYPE_CHECKING:
 
 import contextlib
 
+import numpy as np
 import rustworkx as rx
-import rustworkx.visualization as rxviz
 
 with contextlib.suppress(TypeError):
     Graph: TypeAlias = rx.PyGraph[int, Optional[int]]
@@ -38,6 +38,17 @@ PartialOrder = NewType("PartialOrder", Dict[Tuple[int, int], Set[Tuple[int, int]
 #: Architectures for which precomputed orderings are available
 precomputed_backends = ["rigetti_16", "ibm_guadalupe_16"]
 
+#: Leading bytes of the compact library format, which is a (zip-based) NumPy ``.npz`` archive
+_COMPACT_MAGIC = b"PK\x03\x04"
+#: Version of the compact library format
+_COMPACT_VERSION = 1
+
+#: Partial orders recently constructed by :meth:`SubarchitectureOrder.from_retworkx_graph` in the compact format (see
+#: :func:`_to_arrays`), keyed by a hash of the architecture. Every call constructs a new partial order from the arrays.
+_BUILD_CACHE: OrderedDict[bytes, dict[str, npt.NDArray[Any]]] = OrderedDict()
+#: Maximum total size of the arrays in :data:`_BUILD_CACHE` in bytes. Set to 0 to disable the cache.
+_BUILD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 class SubarchitectureOrder:
     """Class representing the partial order of (sub)architectures."""
@@ -50,30 +61,83 @@ class SubarchitectureOrder:
         self.arch: Graph = rx.PyGraph()
         self.subarch_order: PartialOrder = PartialOrder({})
         self.desirable_subarchitectures: PartialOrder = PartialOrder({})
-        self.isomorphisms: dict[tuple[int, int], dict[tuple[int, int], dict[int, int]]] = {}
+        # embeddings of each subarchitecture into all larger ones, mapping node v of sgs[n][i] to iso[v]
+        self.isomorphisms: dict[tuple[int, int], dict[tuple[int, int], npt.NDArray[np.intp]]] = {}
+        self.__closure_cache: tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]] | None = None
 
         self.__compute_subarchs()
         self.__compute_subarch_order()
         self.__compute_desirable_subarchitectures()
 
+    @classmethod
+    def _empty(cls) -> SubarchitectureOrder:
+        """Create a partial order without any subarchitectures, bypassing the computations of the constructor.
+
+        Used when all attributes are filled in afterwards, e.g., when constructing or loading the partial order.
+        """
+        so = cls.__new__(cls)
+        so.arch = rx.PyGraph()
+        so.sgs = []
+        so.subarch_order = PartialOrder({})
+        so.desirable_subarchitectures = PartialOrder({})
+        so.isomorphisms = {}
+        so.__closure_cache = None  # noqa: SLF001
+        return so
+
     @classmethod
     def from_retworkx_graph(cls, graph: Graph) -> SubarchitectureOrder:
         """Construct the partial order from retworkx graph.
 
+        Recently computed partial orders are cached by the contents of the graph in a compact format, so constructing
+        the partial order of the same architecture again is cheap. Every call returns an independent partial order.
+        Use :meth:`cache_clear` to release the memory held by the cache.
+
         Args:
             graph: retworkx graph representing the architecture.
 
         Returns:
             The resulting partial order.
         """
-        so = SubarchitectureOrder()
-        so.arch = graph
+        key = SubarchitectureOrder.__graph_key(graph)
+        arrays = _BUILD_CACHE.get(key)
+        if arrays is not None:
+            _BUILD_CACHE.move_to_end(key)
+            return _from_arrays(arrays)
+
+        so = SubarchitectureOrder.__build(graph)
+        # the compact format only keeps consecutively indexed integer nodes and no edge data
+        if (
+            _BUILD_CACHE_MAX_BYTES > 0
+            and list(graph.node_indices()) == list(range(graph.num_nodes()))
+            and all(isinstance(node, int) for node in graph.nodes())
+            and all(data is None for data in graph.edges())
+        ):
+            _cache_arrays(key, _to_arrays(so))
+        return so
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the cache of partial orders constructed by :meth:`from_retworkx_graph`."""
+        _BUILD_CACHE.clear()
+
+    @staticmethod
+    def __build(graph: Graph) -> SubarchitectureOrder:
+        """Compute the partial order of an architecture."""
+        so = SubarchitectureOrder._empty()
+        so.arch = graph.copy()
 
         so.__compute_subarchs()  # noqa: SLF001
         so.__compute_subarch_order()  # noqa: SLF001
         so.__compute_desirable_subarchitectures()  # noqa: SLF001
+        so.__closures()  # noqa: SLF001
         return so
 
+    @staticmethod
+    def __graph_key(graph: Graph) -> bytes:
+        """Hash the nodes and the (undirected) edges of a graph."""
+        edges = sorted((min(u, v), max(u, v)) for u, v in graph.edge_list())
+        return hashlib.blake2b(repr((list(graph.node_indices()), graph.nodes(), edges)).encode()).digest()
+
     @classmethod
     def from_coupling_map(cls, coupling_map: Iterable[tuple[int, int]]) -> SubarchitectureOrder:
         """Construct partial order from coupling map defined as set of tuples of connected qubits.
@@ -133,17 +197,34 @@ class SubarchitectureOrder:
     def from_library(cls, lib_name: str | Path) -> SubarchitectureOrder:
         """Construct the partial order from a stored library.
 
+        Both libraries stored via pickle and in the compact ``.npz`` format are supported.
+
         Args:
             lib_name: Path to the library.
 
         Returns:
             The resulting partial order.
         """
-        path = Path(lib_name).with_suffix(".pickle")
+        path = Path(lib_name)
+        if path.suffix != ".npz":
+            path = path.with_suffix(".pickle")
+            # resolve the suffix like store_library, which uses .npz for compact libraries
+            if not path.exists() and path.with_suffix(".npz").exists():
+                path = path.with_suffix(".npz")
         with path.open("rb") as f:
+            if f.read(len(_COMPACT_MAGIC)) == _COMPACT_MAGIC:
+                f.seek(0)
+                with np.load(f, allow_pickle=False) as arrays:
+                    return _from_arrays(arrays)
+            f.seek(0)
             temp = pickle.load(f)  # noqa: S301
 
-        so = SubarchitectureOrder()
+        # libraries stored by older versions contain the isomorphisms as dictionaries
+        for isos in temp.isomorphisms.values():
+            for key, iso in isos.items():
+                if isinstance(iso, dict):
+                    isos[key] = np.array([iso[v] for v in range(len(iso))], dtype=np.intp)
+        so = cls._empty()
         so.__dict__.update(temp.__dict__)
 
         return so
@@ -152,6 +233,8 @@ class SubarchitectureOrder:
     def from_string(cls, name: str) -> SubarchitectureOrder:
         """Construct the partial order from a library name.
 
+        Precomputed libraries are only read once. Every call returns an independent partial order.
+
         Args:
             name: Name of the library.
 
@@ -159,9 +242,7 @@ class SubarchitectureOrder:
             The resulting partial order.
         """
         if name in precomputed_backends:
-            ref = resources.files("mqt.qmap") / "libs" / (name + ".pickle")
-            with resources.as_file(ref) as lib_path:
-                return cls.from_library(lib_path)
+            return _load_precomputed(name)
         return SubarchitectureOrder()
 
     def optimal_candidates(self, nqubits: int) -> list[Graph]:
@@ -181,20 +262,27 @@ class SubarchitectureOrder:
         if nqubits == self.arch.num_nodes():
             return [self.arch]
 
-        cands = self.__cand(nqubits)
-        trans_ord = self.__transitive_closure(self.subarch_order)
-        ref_ord = self.__reflexive_closure(trans_ord)
-
-        opt_cands = set(ref_ord[next(iter(cands))])
-        for cand in cands:
-            opt_cands = opt_cands.intersection(set(ref_ord[cand]))
-
-        ordered_cands = list(opt_cands)
-        ordered_cands.sort()
-        for cand in ordered_cands:
-            opt_cands = opt_cands.difference(trans_ord[cand])
-
-        return [self.sgs[n][i] for (n, i) in opt_cands]
+        keys = self.__keys()
+        index = {key: k for k, key in enumerate(keys)}
+        cands = [index[cand] for cand in self.__cand(nqubits)]
+        if not cands:
+            return []
+        trans_ord, ref_ord, _ = self.__closures()
+
+        upper_bounds = ref_ord[cands]
+        opt_cands = np.ones(len(keys), dtype=bool)
+        # the full architecture (if it is connected) is an upper bound of every subarchitecture
+        full_arch = index.get((self.arch.num_nodes(), 0))
+        # intersect the smallest sets of upper bounds first and stop once nothing or only the full architecture is left
+        for row in upper_bounds[np.argsort(np.count_nonzero(upper_bounds, axis=1), kind="stable")]:
+            opt_cands &= row
+            remaining = np.flatnonzero(opt_cands)
+            if len(remaining) == 0 or (len(remaining) == 1 and remaining[0] == full_arch):
+                break
+        # only keep the minimal elements of the common upper bounds
+        opt_cands &= ~trans_ord[opt_cands].any(axis=0)
+
+        return [self.sgs[n][i] for (n, i) in (keys[k] for k in np.flatnonzero(opt_cands))]
 
     def covering(self, nqubits: int, size: int) -> list[Graph]:
         """Return covering for nqubit circuits.
@@ -211,32 +299,38 @@ class SubarchitectureOrder:
         Note:
             A smaller covering might be found.
         """
-        cov = self.__cand(nqubits)
-        po_trans = self.__transitive_closure(self.subarch_order)
-        ref_trans_po = self.__reflexive_closure(po_trans)
-        queue = list({el for cand in cov for el in ref_trans_po[cand]})
-        queue.sort(reverse=True)
-
-        po_inv = self.__inverse_relation(po_trans)
-
-        while len(cov) > size:
+        keys = self.__keys()
+        index = {key: k for k, key in enumerate(keys)}
+        cov = np.zeros(len(keys), dtype=bool)
+        cov[[index[cand] for cand in self.__cand(nqubits)]] = True
+        _, ref_trans_po, po_inv = self.__closures()
+        queue = list(np.flatnonzero(ref_trans_po[cov].any(axis=0)))
+        queue.reverse()
+
+        while np.count_nonzero(cov) > size:
             d = queue.pop()
-            cov_d = cov.intersection(po_inv[d])
-            if len(cov_d) > 1:
-                cov = cov.difference(cov_d)
-                cov.add(d)
+            cov_d = cov & po_inv[d]
+            if np.count_nonzero(cov_d) > 1:
+                cov &= ~cov_d
+                cov[d] = True
 
-        return [self.sgs[n][i] for n, i in cov]
+        return [self.sgs[n][i] for n, i in (keys[k] for k in np.flatnonzero(cov))]
 
-    def store_library(self, lib_name: str | Path) -> None:
+    def store_library(self, lib_name: str | Path, *, compact: bool = False) -> None:
         """Store ordering.
 
         Args:
             lib_name: Path to the library.
+            compact: Whether to store the ordering in the compact ``.npz`` format instead of pickling it.
+                The compact format only keeps the integer node labels of the graphs and drops edge data.
         """
+        if compact:
+            with Path(lib_name).with_suffix(".npz").open("wb") as f:
+                np.savez_compressed(f, **_to_arrays(self))
+            return
         path = Path(lib_name).with_suffix(".pickle")
         with path.open("wb") as f:
-            pickle.dump(self, f)
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     def draw_subarchitecture(self, subarchitecture: Graph | tuple[int, int]) -> figure.Figure:
         """Create a matplotlib figure showing subarchitecture within the entire architecture.
@@ -250,6 +344,9 @@ class SubarchitectureOrder:
         Returns:
             Matplotlib figure.
         """
+        # drawing is optional, so the visualization module is only imported when needed
+        import rustworkx.visualization as rxviz
+
         if isinstance(subarchitecture, tuple):
             subarchitecture = self.sgs[subarchitecture[0]][subarchitecture[1]]
         colors = [SubarchitectureOrder.inactive_color for _ in range(self.arch.num_nodes())]
@@ -273,20 +370,20 @@ class SubarchitectureOrder:
         return [self.draw_subarchitecture(subarchitecture) for subarchitecture in subarchitectures]
 
     def __compute_subarchs(self) -> None:
-        """Compute all subarchitectures of the architecture."""
-        self.sgs: list[list[Graph]] = [[] for i in range(self.arch.num_nodes() + 1)]
-
-        for i in range(1, self.arch.num_nodes() + 1):
-            node_combinations = combinations(range(self.arch.num_nodes()), i)
-            for sg in (self.arch.subgraph(selected_nodes) for selected_nodes in node_combinations):
-                if rx.is_connected(sg):
-                    new_class = True
-                    for g in self.sgs[i]:
-                        if rx.is_isomorphic(g, sg):
-                            new_class = False
-                            break
-                    if new_class:
-                        self.sgs[i].append(sg)
+        """Compute all subarchitectures of the architecture.
+
+        Subgraphs of different sizes are never isomorphic, so each size is classified independently in a thread pool.
+        """
+        adjacency = rx.adjacency_matrix(self.arch) != 0
+        position = np.zeros(max(self.arch.node_indices(), default=-1) + 1, dtype=np.intp)
+        position[list(self.arch.node_indices())] = np.arange(self.arch.num_nodes())
+        with ThreadPoolExecutor(max_workers=_max_workers()) as executor:
+            self.sgs: list[list[Graph]] = list(
+                executor.map(
+                    lambda node_sets: self.__isomorphism_classes(node_sets, adjacency, position),
+                    SubarchitectureOrder.__connected_node_sets(self.arch),
+                )
+            )
         # init orders
         for n in range(self.arch.num_nodes() + 1):
             for i in range(len(self.sgs[n])):
@@ -294,136 +391,426 @@ class SubarchitectureOrder:
                 self.desirable_subarchitectures[(n, i)] = set()
                 self.isomorphisms[(n, i)] = {}
 
+    def __isomorphism_classes(
+        self, node_sets: list[tuple[int, ...]], adjacency: npt.NDArray[np.bool_], position: npt.NDArray[np.intp]
+    ) -> list[Graph]:
+        """Return one induced subgraph of the architecture per isomorphism class among the given node sets.
+
+        Args:
+            node_sets: Node sets of equal size inducing connected subgraphs.
+            adjacency: Adjacency matrix of the architecture.
+            position: Row of each node of the architecture in the adjacency matrix.
+        """
+        if not node_sets:
+            return []
+        node_sets = sorted(node_sets)
+        rows = position[np.array(node_sets)]
+        signatures = SubarchitectureOrder.__batch_signatures(adjacency[rows[:, :, None], rows[:, None, :]])
+
+        sgs: list[Graph] = []
+        # isomorphic subgraphs share the same signature, so only those have to be compared
+        classes: dict[bytes, list[Graph]] = {}
+        for selected_nodes, signature in zip(node_sets, signatures):
+            candidates = classes.setdefault(signature.tobytes(), [])
+            sg = self.arch.subgraph(list(selected_nodes))
+            if not any(rx.is_isomorphic(g, sg) for g in candidates):
+                candidates.append(sg)
+                sgs.append(sg)
+        return sgs
+
+    @staticmethod
+    def __batch_signatures(adjacency: npt.NDArray[np.bool_], rounds: int = 3) -> npt.NDArray[np.uint64]:
+        """Compute isomorphism-invariant signatures of graphs of equal size via Weisfeiler-Lehman color refinement.
+
+        Works on a stack of adjacency matrices at once. The colors of the neighbors of a node are combined by summing
+        their hashes, which keeps the refinement vectorized.
+
+        Args:
+            adjacency: Adjacency matrices of the graphs, stacked along the first axis.
+            rounds: Number of refinement rounds.
+
+        Returns:
+            The sorted node colors of each graph, one graph per row.
+        """
+        adj = adjacency.astype(np.uint64)
+        labels: npt.NDArray[np.uint64] = adj.sum(axis=2, dtype=np.uint64)
+        for _ in range(rounds):
+            nbr_labels = (adj @ SubarchitectureOrder.__mix(labels)[:, :, None])[:, :, 0]
+            labels = SubarchitectureOrder.__mix(labels * np.uint64(0x9E3779B97F4A7C15) + nbr_labels)
+        return np.sort(labels, axis=1)
+
+    @staticmethod
+    def __mix(x: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+        """Scramble the bits of unsigned 64-bit integers (finalizer of MurmurHash3)."""
+        y: npt.NDArray[np.uint64] = x ^ (x >> np.uint64(33))
+        y *= np.uint64(0xFF51AFD7ED558CCD)
+        y ^= y >> np.uint64(33)
+        return y
+
+    @staticmethod
+    def __connected_node_sets(graph: Graph) -> list[list[tuple[int, ...]]]:
+        """Enumerate the node sets of all connected induced subgraphs of a graph, bucketed by size.
+
+        Uses Redelmeier's algorithm: every connected set is grown outward from its smallest node by only adding nodes
+        from an extension set that excludes neighbors of nodes added earlier. Hence, every connected set is produced
+        exactly once and disconnected node sets are never visited.
+        """
+        node_sets: list[list[tuple[int, ...]]] = [[] for _ in range(graph.num_nodes() + 1)]
+        neighbors = {v: set(graph.neighbors(v)) for v in graph.node_indices()}
+
+        def extend(current: frozenset[int], extension: set[int], forbidden: set[int], root: int) -> None:
+            node_sets[len(current)].append(tuple(sorted(current)))
+            extension = set(extension)
+            while extension:
+                w = extension.pop()
+                new_extension = extension | {u for u in neighbors[w] if u > root and u not in forbidden}
+                extend(current | {w}, new_extension, forbidden | neighbors[w], root)
+
+        for v in graph.node_indices():
+            extend(frozenset({v}), {u for u in neighbors[v] if u > v}, neighbors[v] | {v}, v)
+        return node_sets
+
+    @staticmethod
+    def __signature(graph: Graph, rounds: int = 3) -> tuple[int, ...]:
+        """Compute an isomorphism-invariant signature of a graph via Weisfeiler-Lehman color refinement.
+
+        Isomorphic graphs always have the same signature, while non-isomorphic graphs rarely do.
+        """
+        neighbors = {v: graph.neighbors(v) for v in graph.node_indices()}
+        labels = {v: len(nbrs) for v, nbrs in neighbors.items()}
+        for _ in range(rounds):
+            labels = {v: hash((labels[v], *sorted(labels[u] for u in nbrs))) for v, nbrs in neighbors.items()}
+        return tuple(sorted(labels.values()))
+
     def __compute_subarch_order(self) -> None:
-        """Compute subarchitecture order."""
-        for n, sgs_n in enumerate(self.sgs[:-1]):
-            for i, sg in enumerate(sgs_n):
-                for j, parent_sg in enumerate(self.sgs[n + 1]):
-                    matcher = rx.graph_vf2_mapping(parent_sg, sg, subgraph=True)
-                    for iso in matcher:
-                        self.subarch_order[(n, i)].add((n + 1, j))
-                        iso_rev = {val: key for key, val in iso.items()}
-                        self.isomorphisms[(n, i)][(n + 1, j)] = iso_rev
-                        break  # One isomorphism suffices
+        """Compute subarchitecture order.
+
+        The parents of each subarchitecture are searched independently in a thread pool.
+        A subarchitecture embeds into a parent iff it is isomorphic to the parent with one node removed, so only
+        parents that have a node-deleted subgraph with the same signature and number of triangles are checked with VF2.
+        """
+        deletion_signatures = [[SubarchitectureOrder.__deletion_signatures(sg) for sg in sgs_n] for sgs_n in self.sgs]
+        keys = [(n, i) for n, sgs_n in enumerate(self.sgs[:-1]) for i in range(len(sgs_n))]
+        with ThreadPoolExecutor(max_workers=_max_workers()) as executor:
+            for (n, i), embeddings in zip(
+                keys,
+                executor.map(
+                    lambda key: self.__parent_embeddings(key[0], key[1], deletion_signatures[key[0] + 1]), keys
+                ),
+            ):
+                for j, iso_rev in embeddings.items():
+                    self.subarch_order[(n, i)].add((n + 1, j))
+                    self.isomorphisms[(n, i)][(n + 1, j)] = iso_rev
+
+    @staticmethod
+    def __deletion_signatures(graph: Graph) -> set[tuple[int, ...]]:
+        """Return the embedding signatures of all subgraphs of a graph with exactly one node removed.
+
+        Equivalent to calling __embedding_signature(graph.subgraph(...)) for every node, without building the subgraphs.
+        """
+        neighbors = {v: set(graph.neighbors(v)) for v in graph.node_indices()}
+        degrees = {v: len(nbrs) for v, nbrs in neighbors.items()}
+        triangles = SubarchitectureOrder.__triangles(neighbors)
+        num_triangles = sum(triangles.values()) // 3
+        signatures = set()
+        for removed, removed_nbrs in neighbors.items():
+            deg = {v: d - (v in removed_nbrs) for v, d in degrees.items() if v != removed}
+            labels = (hash((deg[v], *sorted(deg[u] for u in neighbors[v] if u != removed))) for v in deg)
+            signatures.add((num_triangles - triangles[removed], *sorted(labels)))
+        return signatures
+
+    @staticmethod
+    def __embedding_signature(graph: Graph) -> tuple[int, ...]:
+        """Compute the number of triangles followed by the single-round signature of a graph."""
+        triangles = SubarchitectureOrder.__triangles({v: set(graph.neighbors(v)) for v in graph.node_indices()})
+        return (sum(triangles.values()) // 3, *SubarchitectureOrder.__signature(graph, rounds=1))
+
+    @staticmethod
+    def __triangles(neighbors: dict[int, set[int]]) -> dict[int, int]:
+        """Count the triangles each node is part of, given the neighbors of all nodes."""
+        return {v: sum(len(nbrs & neighbors[u]) for u in nbrs) // 2 for v, nbrs in neighbors.items()}
+
+    def __parent_embeddings(
+        self, n: int, i: int, parent_signatures: list[set[tuple[int, ...]]]
+    ) -> dict[int, npt.NDArray[np.intp]]:
+        """Return an embedding of sgs[n][i] into each subarchitecture sgs[n+1][j] containing it, keyed by j."""
+        sg = self.sgs[n][i]
+        signature = SubarchitectureOrder.__embedding_signature(sg)
+        embeddings = {}
+        for j, parent_sg in enumerate(self.sgs[n + 1]):
+            if signature not in parent_signatures[j]:
+                continue
+            iso = next(rx.graph_vf2_mapping(parent_sg, sg, subgraph=True), None)
+            if iso is not None:  # One isomorphism suffices
+                iso_rev = np.empty(n, dtype=np.intp)
+                iso_rev[list(iso.values())] = list(iso.keys())
+                embeddings[j] = iso_rev
+        return embeddings
 
     def __complete_isos(self) -> None:
-        """Complete isomorphisms."""
+        """Complete isomorphisms.
+
+        A subarchitecture reachable via several parents keeps the isomorphism composed via the last of them.
+        Hence, the parents are visited in reverse and only isomorphisms that are not known yet are composed.
+        """
         for n in reversed(range(1, len(self.sgs[:-1]))):
             for i in range(len(self.sgs[n])):
-                for _, i_prime in self.subarch_order[(n, i)]:
+                for _, i_prime in reversed(list(self.subarch_order[(n, i)])):
                     self.__combine_iso_with_parent(n, i, i_prime)
 
     def __combine_iso_with_parent(self, n: int, i: int, j: int) -> None:
-        """Combine all isomorphisms from sgs[n][i] with those from sgs[n+1][j]."""
-        first = self.isomorphisms[(n, i)][(n + 1, j)]
+        """Combine all isomorphisms from sgs[n][i] with those from sgs[n+1][j] that are not known yet."""
+        isos = self.isomorphisms[(n, i)]
+        first = isos[(n + 1, j)]
         for (row, k), second in self.isomorphisms[(n + 1, j)].items():
-            self.isomorphisms[(n, i)][(row, k)] = SubarchitectureOrder.__combine_isos(first, second)
+            if (row, k) not in isos:
+                isos[(row, k)] = SubarchitectureOrder.__combine_isos(first, second)
 
     @staticmethod
-    def __combine_isos(first: dict[int, int], second: dict[int, int]) -> dict[int, int]:
+    def __combine_isos(first: npt.NDArray[np.intp], second: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
         """Combine two isomorphisms."""
-        combined = {}
-        for src, img in first.items():
-            combined[src] = second[img]
-        return combined
+        return second[first]
 
-    def __transitive_closure(self, po: PartialOrder) -> PartialOrder:
-        """Compute transitive closure of partial order."""
-        po_trans: PartialOrder = PartialOrder({})
-        po_trans[self.arch.num_nodes(), 0] = set()
+    def __keys(self) -> list[tuple[int, int]]:
+        """Return all subarchitectures ordered by size and index, i.e., in the order of the rows of the closures."""
+        return [(n, i) for n, sgs_n in enumerate(self.sgs) for i in range(len(sgs_n))]
 
-        for n in reversed(range(1, len(self.sgs[:-1]))):
-            for i in range(len(self.sgs[n])):
-                new_rel = set(po[(n, i)])
-                po_trans[(n, i)] = new_rel.copy()
-                for n_prime, i_prime in po_trans[(n, i)]:
-                    new_rel = new_rel.union(po_trans[(n_prime, i_prime)])
-                po_trans[(n, i)] = new_rel
+    def __closures(self) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """Return the transitive closure, its reflexive closure and its inverse relation of the subarchitecture order.
 
-        return po_trans
+        All three are boolean reachability matrices whose rows and columns follow the order of :meth:`__keys`.
+        Subarchitectures are only related to subarchitectures with one more node, so a single pass from the largest
+        to the smallest subarchitectures computes every row from the already completed rows of its parents.
+        The order does not change after construction, so the closures are computed once and cached.
+        """
+        if self.__closure_cache is None:
+            keys = self.__keys()
+            index = {key: k for k, key in enumerate(keys)}
+            trans = np.zeros((len(keys), len(keys)), dtype=bool)
+            for k in reversed(range(len(keys))):
+                parents = [index[e] for e in self.subarch_order.get(keys[k], ())]
+                trans[k, parents] = True
+                trans[k] |= trans[parents].any(axis=0)
+            ref = trans | np.identity(len(keys), dtype=bool)
+            self.__closure_cache = (trans, ref, np.ascontiguousarray(trans.T))
+        return self.__closure_cache
+
+    def __path_order_less(self, n: int, i: int, distances: list[npt.NDArray[np.float64]]) -> list[tuple[int, int]]:
+        """Return all larger subarchitectures sgs[n_prime][i_prime] such that sgs[n][i] is less in the path order.
+
+        The embeddings into subarchitectures of the same size are checked together by gathering the distances between
+        the images of all embeddings at once.
 
-    @classmethod
-    def __reflexive_closure(cls, po: PartialOrder) -> PartialOrder:
-        """Compute reflexive closure of partial order."""
-        po_ref = PartialOrder({})
-        for k, v in po.items():
-            v_copy = v.copy()
-            v_copy.add(k)
-            po_ref[k] = v_copy
-        return po_ref
-
-    def __inverse_relation(self, po: PartialOrder) -> PartialOrder:
-        """Compute inverse relation of partial order."""
-        po_inv = PartialOrder({})
-        for n in range(self.arch.num_nodes() + 1):
-            for i in range(len(self.sgs[n])):
-                po_inv[(n, i)] = set()
-        for k, v in po.items():
-            for e in v:
-                po_inv[e].add(k)
-        return po_inv
-
-    def __path_order_less(self, n: int, i: int, n_prime: int, i_prime: int) -> bool:
-        """Check if sgs[n][i] is less than sgs[n_prime][i_prime] in the path order."""
-        lhs = self.sgs[n][i]
-        rhs = self.sgs[n_prime][i_prime]
-        iso = self.isomorphisms[(n, i)][(n_prime, i_prime)]
-        for v in range(lhs.num_nodes()):
-            for w in range(lhs.num_nodes()):
-                if v is w:
-                    continue
-                if (
-                    rx.dijkstra_shortest_path_lengths(lhs, v, lambda _x: 1, goal=w)[w]
-                    > rx.dijkstra_shortest_path_lengths(rhs, iso[v], lambda _x: 1, goal=iso[w])[iso[w]]
-                ):
-                    return True
-        return False
+        Args:
+            n: Size of the smaller subarchitecture.
+            i: Index of the smaller subarchitecture.
+            distances: Stacked distance matrices of all subarchitectures of each size.
+        """
+        by_size: dict[int, list[tuple[int, npt.NDArray[np.intp]]]] = {}
+        for (n_prime, i_prime), iso in self.isomorphisms[(n, i)].items():
+            by_size.setdefault(n_prime, []).append((i_prime, iso))
+
+        greater: list[tuple[int, int]] = []
+        for n_prime, isos in by_size.items():
+            parents = np.array([i_prime for i_prime, _ in isos], dtype=np.intp)
+            idx = np.stack([iso for _, iso in isos])
+            images = distances[n_prime][parents[:, None, None], idx[:, :, None], idx[:, None, :]]
+            less = np.any(distances[n][i] > images, axis=(1, 2))
+            greater.extend((n_prime, i_prime) for i_prime in parents[less].tolist())
+        return greater
 
     def __compute_desirable_subarchitectures(self) -> None:
-        """Compute desirable subarchitectures."""
+        """Compute desirable subarchitectures.
+
+        The desirable subarchitectures of each subarchitecture are determined independently in a thread pool.
+        """
         self.__complete_isos()
-        for n in reversed(range(1, len(self.sgs[:-1]))):
-            for i in range(len(self.sgs[n])):
-                val = self.isomorphisms[(n, i)]
-                for n_prime, i_prime in val:
-                    if self.__path_order_less(n, i, n_prime, i_prime):
-                        self.desirable_subarchitectures[(n, i)].add((n_prime, i_prime))
-                des = list(self.desirable_subarchitectures[(n, i)])
-                des.sort()
-                new_des: set[tuple[int, int]] = set()
-                for j, (n_prime, i_prime) in enumerate(reversed(des)):
-                    idx = len(des) - j - 1
-                    if not any((n_prime, i_prime) in self.subarch_order[k] for k in des[:idx]):
-                        new_des.add((n_prime, i_prime))
-
-                self.desirable_subarchitectures[(n, i)] = new_des
-                if len(self.desirable_subarchitectures[(n, i)]) == 0:
-                    self.desirable_subarchitectures[(n, i)].add((n, i))
+        distances = [
+            np.array([rx.distance_matrix(sg) for sg in sgs_n]).reshape(len(sgs_n), n, n)
+            for n, sgs_n in enumerate(self.sgs)
+        ]
+        keys = [(n, i) for n in reversed(range(1, len(self.sgs[:-1]))) for i in range(len(self.sgs[n]))]
+        with ThreadPoolExecutor(max_workers=_max_workers()) as executor:
+            for key, des in zip(keys, executor.map(lambda key: self.__desirable_of(key[0], key[1], distances), keys)):
+                self.desirable_subarchitectures[key] = des
         self.desirable_subarchitectures[self.arch.num_nodes(), 0] = {(self.arch.num_nodes(), 0)}
 
+    def __desirable_of(self, n: int, i: int, distances: list[npt.NDArray[np.float64]]) -> set[tuple[int, int]]:
+        """Compute the desirable subarchitectures of sgs[n][i]."""
+        if np.all(distances[n][i] <= 1):
+            # distances in a fully connected subarchitecture cannot become any shorter
+            return {(n, i)}
+        des = self.__path_order_less(n, i, distances)
+        des.sort()
+        # keep all subarchitectures that are not a parent of a smaller (i.e., preceding) one in a single pass
+        new_des: set[tuple[int, int]] = set()
+        parents: set[tuple[int, int]] = set()
+        for key in des:
+            if key not in parents:
+                new_des.add(key)
+            parents.update(self.subarch_order[key])
+
+        if len(new_des) == 0:
+            new_des.add((n, i))
+        return new_des
+
     def __cand(self, nqubits: int) -> set[tuple[int, int]]:
+        # only look up the subarchitectures of the given size instead of scanning the whole relation
         return {
-            des for (n, i), desirables in self.desirable_subarchitectures.items() if n == nqubits for des in desirables
+            des for i in range(len(self.sgs[nqubits])) for des in self.desirable_subarchitectures.get((nqubits, i), ())
         }
 
 
+def _max_workers() -> int | None:
+    """Return the number of threads used to compute partial orders.
+
+    Defaults to the number of CPUs and can be set via the ``MQT_QMAP_JOBS`` environment variable, e.g., to avoid
+    oversubscription when partial orders are computed from within an already parallelized application.
+    """
+    jobs = os.environ.get("MQT_QMAP_JOBS")
+    if not jobs:
+        return os.cpu_count()
+    if not jobs.isdigit() or int(jobs) < 1:
+        msg = f"MQT_QMAP_JOBS must be a positive integer, got {jobs!r}."
+        raise ValueError(msg)
+    return int(jobs)
+
+
+def _cache_arrays(key: bytes, arrays: dict[str, npt.NDArray[Any]]) -> None:
+    """Add the arrays of a partial order to :data:`_BUILD_CACHE`, evicting the least recently used ones if needed."""
+    size = sum(array.nbytes for array in arrays.values())
+    if size > _BUILD_CACHE_MAX_BYTES:
+        return
+    for array in arrays.values():
+        array.setflags(write=False)
+    _BUILD_CACHE[key] = arrays
+    while sum(array.nbytes for cached in _BUILD_CACHE.values() for array in cached.values()) > _BUILD_CACHE_MAX_BYTES:
+        _BUILD_CACHE.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def _load_precomputed_arrays(name: str) -> dict[str, npt.NDArray[Any]]:
+    """Read the arrays of a precomputed library shipped with the package, caching the result."""
+    # the backport of importlib.resources is only needed (and imported) when a library is actually loaded
+    if sys.version_info < (3, 10, 0):
+        import importlib_resources as resources
+    else:
+        from importlib import resources
+
+    ref = resources.files("mqt.qmap") / "libs" / (name + ".npz")
+    with resources.as_file(ref) as path, np.load(path, allow_pickle=False) as npz:
+        arrays = dict(npz)
+    for array in arrays.values():
+        array.setflags(write=False)
+    return arrays
+
+
+def _load_precomputed(name: str) -> SubarchitectureOrder:
+    """Load a precomputed library shipped with the package as a new partial order."""
+    return _from_arrays(_load_precomputed_arrays(name))
+
+
+def _flatten_relation(
+    rel: Mapping[tuple[int, int], Iterable[tuple[int, int]]],
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+    """Flatten a relation into its keys, the number of related elements per key, and the related elements."""
+    related = [list(rel_k) for rel_k in rel.values()]
+    return (
+        np.array(list(rel), dtype=int).reshape(-1, 2),
+        np.array([len(rel_k) for rel_k in related], dtype=int),
+        np.array([e for rel_k in related for e in rel_k], dtype=int).reshape(-1, 2),
+    )
+
+
+def _unflatten_relation(
+    keys: npt.NDArray[np.int_], counts: npt.NDArray[np.int_], related: npt.NDArray[np.int_]
+) -> list[tuple[tuple[int, int], list[tuple[int, int]]]]:
+    """Inverse of :func:`_flatten_relation`, returning the relation as a list of key-value pairs."""
+    related_tuples = list(map(tuple, related.tolist()))
+    offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+    return [((n, i), related_tuples[offsets[k] : offsets[k + 1]]) for k, (n, i) in enumerate(keys.tolist())]
+
+
+def _to_arrays(so: SubarchitectureOrder) -> dict[str, Any]:
+    """Convert a partial order to the arrays stored in the compact library format."""
+    graphs = [so.arch] + [sg for sgs_n in so.sgs for sg in sgs_n]
+    arrays = {
+        "version": np.array(_COMPACT_VERSION),
+        "num_sgs": np.array([len(sgs_n) for sgs_n in so.sgs], dtype=int),
+        "num_edges": np.array([g.num_edges() for g in graphs], dtype=int),
+        "nodes": np.array([node for g in graphs for node in g.nodes()], dtype=int),
+        "edges": np.array([e for g in graphs for e in g.edge_list()], dtype=int).reshape(-1, 2),
+    }
+    for name, rel in (("order", so.subarch_order), ("desirable", so.desirable_subarchitectures)):
+        arrays[name + "_keys"], arrays[name + "_counts"], arrays[name] = _flatten_relation(rel)
+    arrays["iso_keys"], arrays["iso_counts"], arrays["iso"] = _flatten_relation(so.isomorphisms)
+    arrays["iso_maps"] = np.concatenate([
+        np.empty(0, dtype=np.intp),
+        *(iso for isos in so.isomorphisms.values() for iso in isos.values()),
+    ])
+    return arrays
+
+
+def _from_arrays(arrays: Mapping[str, npt.NDArray[np.int_]]) -> SubarchitectureOrder:
+    """Construct a partial order from the arrays stored in the compact library format."""
+    if int(arrays["version"]) != _COMPACT_VERSION:
+        msg = f"Unsupported library version {int(arrays['version'])}, expected {_COMPACT_VERSION}."
+        raise ValueError(msg)
+
+    num_sgs = arrays["num_sgs"].tolist()
+    num_nodes = [len(num_sgs) - 1] + [n for n, num_sgs_n in enumerate(num_sgs) for _ in range(num_sgs_n)]
+    nodes, edges = arrays["nodes"].tolist(), list(map(tuple, arrays["edges"].tolist()))
+    node_offsets = np.concatenate(([0], np.cumsum(num_nodes))).tolist()
+    edge_offsets = np.concatenate(([0], np.cumsum(arrays["num_edges"]))).tolist()
+    graphs = []
+    for k in range(len(num_nodes)):
+        g: Graph = rx.PyGraph()
+        g.add_nodes_from(nodes[node_offsets[k] : node_offsets[k + 1]])
+        g.add_edges_from_no_data(edges[edge_offsets[k] : edge_offsets[k + 1]])
+        graphs.append(g)
+
+    so = SubarchitectureOrder._empty()  # noqa: SLF001
+    so.arch = graphs[0]
+    so.sgs = []
+    offset = 1
+    for num_sgs_n in num_sgs:
+        so.sgs.append(graphs[offset : offset + num_sgs_n])
+        offset += num_sgs_n
+    so.subarch_order = PartialOrder({
+        key: set(rel) for key, rel in _unflatten_relation(arrays["order_keys"], arrays["order_counts"], arrays["order"])
+    })
+    so.desirable_subarchitectures = PartialOrder({
+        key: set(rel)
+        for key, rel in _unflatten_relation(arrays["desirable_keys"], arrays["desirable_counts"], arrays["desirable"])
+    })
+    iso_maps = arrays["iso_maps"].astype(np.intp)
+    so.isomorphisms = {}
+    offset = 0
+    for (n, i), rel in _unflatten_relation(arrays["iso_keys"], arrays["iso_counts"], arrays["iso"]):
+        so.isomorphisms[(n, i)] = {}
+        for e in rel:
+            so.isomorphisms[(n, i)][e] = iso_maps[offset : offset + n]
+            offset += n
+    return so
+
+
 def ibm_guadalupe_subarchitectures() -> SubarchitectureOrder:
     """Load the precomputed ibm guadalupe subarchitectures.
 
+    The library is only read once. Every call returns an independent partial order.
+
     Returns:
         The subarchitecture order for the ibm_guadalupe architecture.
     """
-    ref = resources.files("mqt.qmap") / "libs" / "ibm_guadalupe_16.pickle"
-    with resources.as_file(ref) as path:
-        return SubarchitectureOrder.from_library(path)
+    return _load_precomputed("ibm_guadalupe_16")
 
 
 def rigetti_16_subarchitectures() -> SubarchitectureOrder:
     """Load the precomputed rigetti subarchitectures.
 
+    The library is only read once. Every call returns an independent partial order.
+
     Returns:
         The subarchitecture order for the 16-qubit Rigetti architecture.
     """
-    ref = resources.files("mqt.qmap") / "libs" / "rigetti_16.pickle"
-    with resources.as_file(ref) as path:
-        return SubarchitectureOrder.from_library(path)
+    return _load_precomputed("rigetti_16")
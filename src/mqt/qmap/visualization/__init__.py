@@ -6,7 +6,35 @@ See README.md or go to https://github.com/cda-tum/qmap for more information.
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .search_visualizer import SearchVisualizer
-from .visualize_search_graph import SearchNode, visualize_search_graph
+
+if TYPE_CHECKING:
+    from .visualize_search_graph import SearchNode, visualize_search_graph
+
+#: Attributes that are only imported on first access, since they require the (slow to import) plotting libraries.
+#: This way, a :class:`SearchVisualizer` can be used to log the data of a search without importing them.
+_LAZY = {
+    "SearchNode": "visualize_search_graph",
+    "visualize_search_graph": "visualize_search_graph",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import the plotting functionality of the package on first access."""
+    if name not in _LAZY:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the ones that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = ["SearchNode", "SearchVisualizer", "visualize_search_graph"]
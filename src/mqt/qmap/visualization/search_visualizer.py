@@ -8,12 +8,10 @@ from typing import TYPE_CHECKING, Callable, Literal, MutableMapping
 if TYPE_CHECKING:
     import types
 
+    from ipywidgets import Widget
     from typing_extensions import Self
 
-from .visualize_search_graph import SearchNode, visualize_search_graph
-
-if TYPE_CHECKING:
-    from ipywidgets import Widget
+    from .visualize_search_graph import SearchNode
 
 
 class SearchVisualizer:
@@ -65,6 +63,7 @@ class SearchVisualizer:
         swap_arrow_spacing: float = 0.05,
         swap_arrow_offset: float = 0.05,
         use3d: bool = True,
+        use_webgl: bool = True,
         projection: Literal["orthographic", "perspective"] = "perspective",
         width: int = 1400,
         height: int = 700,
@@ -96,6 +95,7 @@ class SearchVisualizer:
         search_progression_step: int = 10,
         search_progression_speed: float = 2,
         plotly_settings: MutableMapping[str, MutableMapping[str, object]] | None = None,
+        backend: Literal["plotly", "matplotlib"] = "plotly",
     ) -> Widget:
         """Creates a widget to visualize the search graph.
 
@@ -109,6 +109,7 @@ class SearchVisualizer:
             swap_arrow_spacing (float): Lateral spacing between arrows indicating swaps on the qubit connectivity graph. Defaults to 0.05.
             swap_arrow_offset (float): Offset of heads and shaft of swap arrows from qubits they are pointing to/from. Defaults to 0.05.
             use3d (bool): If a 3D graph should be used for the search graph using the z-axis to plot data features. Defaults to True.
+            use_webgl (bool): If the search nodes of a 2D search graph should be rendered with WebGL (plotly.graph_objects.Scattergl), which stays responsive for large search graphs. Defaults to True.
             projection (Literal['orthographic', 'perspective']): Projection type to use in 3D graphs. Defaults to "perspective".
             width (int): Pixel width of the widget. Defaults to 1400.
             height (int): Pixel height of the widget. Defaults to 700.
@@ -137,6 +138,7 @@ class SearchVisualizer:
             show_search_progression (bool): If the search progression should be animated. Defaults to True.
             search_progression_step (int): Step size (in number of nodes added) of search progression animation. Defaults to 10.
             search_progression_speed (float): Speed of the search progression animation. Defaults to 2.
+            backend (Literal['plotly', 'matplotlib']): Library used to render the search graph. The matplotlib backend renders a static 2D image of the search graph (and the initial layout on the architecture) of a single layer, e.g., for headless environments. It neither requires a running Jupyter frontend nor supports the interactive options (3D, search progression, showing layouts and swaps, Plotly settings). Defaults to "plotly".
             plotly_settings (MutableMapping[str, MutableMapping[str, any]] | None): Plotly configuration dictionaries to be passed through. Defaults to None.
         .. code-block:: text
 
@@ -167,6 +169,9 @@ class SearchVisualizer:
         if self.data_logging_path is None:
             msg = "SearchVisualizer has already been closed and data logs have been discarded."
             raise ValueError(msg)
+        # the plotting libraries are only imported once something is visualized (and not when only logging data)
+        from .visualize_search_graph import visualize_search_graph
+
         return visualize_search_graph(
             data_logging_path=self.data_logging_path,
             layer=layer,
@@ -178,6 +183,7 @@ class SearchVisualizer:
             swap_arrow_spacing=swap_arrow_spacing,
             swap_arrow_offset=swap_arrow_offset,
             use3d=use3d,
+            use_webgl=use_webgl,
             projection=projection,
             width=width,
             height=height,
@@ -207,4 +213,5 @@ class SearchVisualizer:
             search_progression_step=search_progression_step,
             search_progression_speed=search_progression_speed,
             plotly_settings=plotly_settings,
+            backend=backend,
         )
@@ -6,6 +6,7 @@ import json
 import re
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from random import shuffle
 from typing import TYPE_CHECKING, Callable, Iterable, Literal, MutableMapping, Sequence, Tuple, TypedDict, Union
@@ -139,6 +140,11 @@ class FinalNodeNotFoundError(Exception):
     """Raised when the final solution node of a search graph could not be found."""
 
 
+def _parse_swap(swap: str) -> tuple[int, int]:
+    q0, q1 = swap.split(" ", 2)[:2]
+    return int(q0), int(q1)
+
+
 def _parse_search_graph(file_path: str, final_node_id: int, only_solution_path: bool) -> tuple[nx.Graph, int]:
     graph = nx.Graph()
     root: None | int = None
@@ -148,6 +154,8 @@ def _parse_search_graph(file_path: str, final_node_id: int, only_solution_path:
             line = linestr.strip().split(";")
             nodeid = int(line[0])
             parentid = int(line[1])
+            # int() ignores surrounding whitespace, so the fields do not have to be stripped before converting them
+            swaps = line[8].strip()
             nodes[nodeid] = SearchNode(
                 nodeid,
                 parentid if parentid != nodeid else None,
@@ -157,10 +165,8 @@ def _parse_search_graph(file_path: str, final_node_id: int, only_solution_path:
                 line[5].strip() == "1",
                 nodeid == final_node_id,
                 int(line[6]),
-                tuple(int(q) for q in line[7].strip().split(",")),
-                ()
-                if len(line[8].strip()) == 0
-                else tuple((int(swap.split(" ")[0]), int(swap.split(" ")[1])) for swap in line[8].strip().split(",")),
+                tuple(map(int, line[7].split(","))),
+                () if not swaps else tuple(_parse_swap(swap) for swap in swaps.split(",")),
             )
             if parentid == nodeid:
                 root = nodeid
@@ -188,6 +194,12 @@ def _parse_search_graph(file_path: str, final_node_id: int, only_solution_path:
     return graph, root
 
 
+def _graphviz_layout(graph: nx.Graph, method: str, root: int | None = None) -> MutableMapping[int, Position]:
+    # only the node positions are used (edges are drawn as straight lines), so Graphviz can skip routing splines
+    graph.graph["graph"] = {**graph.graph.get("graph", {}), "splines": "line"}
+    return graphviz_layout(graph, prog=method, root=root)  # type: ignore[no-any-return]
+
+
 def _layout_search_graph(
     search_graph: nx.Graph,
     root: int,
@@ -199,7 +211,7 @@ def _layout_search_graph(
             search_graph, root, origin=(0, 0), scalex=60, scaley=-1
         )
     else:
-        pos = graphviz_layout(search_graph, prog=method, root=root)
+        pos = _graphviz_layout(search_graph, method, root)
 
     if not tapered_layer_heights:
         return pos
@@ -243,6 +255,34 @@ def _layout_search_graph(
     return pos
 
 
+@lru_cache(maxsize=32)
+def _load_search_graph(
+    file_path: str,
+    modified: int,  # noqa: ARG001
+    final_node_id: int,
+    only_solution_path: bool,
+    method: Literal["walker", "dot", "neato", "fdp", "sfdp", "circo", "twopi", "osage", "patchwork"],
+    tapered_layer_heights: bool,
+) -> tuple[nx.Graph, MutableMapping[int, Position]]:
+    """Parse and layout the search graph of a layer.
+
+    The results are cached (and must not be modified), so that revisiting a layer or visualizing the same data log
+    again does not repeat the layouting. The modification time of the log file is part of the key to notice updates.
+    """
+    graph, root = _parse_search_graph(file_path, final_node_id, only_solution_path)
+    return graph, _layout_search_graph(graph, root, method, tapered_layer_heights)
+
+
+@lru_cache(maxsize=32)
+def _layout_architecture(
+    file_path: str,
+    modified: int,  # noqa: ARG001
+    method: Literal["dot", "neato", "fdp", "sfdp", "circo", "twopi", "osage", "patchwork"],
+) -> MutableMapping[int, Position]:
+    """Layout the architecture graph logged at the given path (cached like :func:`_load_search_graph`)."""
+    return _graphviz_layout(_parse_arch_graph(file_path), method)
+
+
 def _prepare_search_graph_scatters(
     number_of_scatters: int,
     color_scale: Sequence[Colorscale],
@@ -250,11 +290,12 @@ def _prepare_search_graph_scatters(
     search_node_colorbar_title: Sequence[str | None],
     search_node_colorbar_spacing: float,
     use3d: bool,
+    use_webgl: bool,
     draw_stems: bool,
     draw_edges: bool,
     plotly_settings: _PlotlySettings,
 ) -> tuple[
-    Sequence[go.Scatter | go.Scatter3d], Sequence[go.Scatter | go.Scatter3d], go.Scatter3d | None
+    Sequence[go.Scatter | go.Scattergl | go.Scatter3d], Sequence[go.Scatter | go.Scatter3d], go.Scatter3d | None
 ]:  # nodes, edges, stems
     if not use3d:
         _copy_to_dict(
@@ -273,7 +314,8 @@ def _prepare_search_graph_scatters(
         if search_node_colorbar_title[0] is None:
             ps = deepcopy(ps)
             del ps["marker"]["colorbar"]  # type: ignore[attr-defined]
-        node_scatter = go.Scatter(**ps)
+        # WebGL draws all markers at once instead of creating an SVG element for each search node
+        node_scatter = go.Scattergl(**ps) if use_webgl else go.Scatter(**ps)
         node_scatter.x = []
         node_scatter.y = []
         if draw_edges:
@@ -470,7 +512,7 @@ def _prepare_search_graph_scatter_data(
 
 
 def _draw_search_graph_nodes(
-    scatters: Sequence[go.Scatter | go.Scatter3d],
+    scatters: Sequence[go.Scatter | go.Scattergl | go.Scatter3d],
     x: Sequence[float],
     y: Sequence[float],
     z: Sequence[Sequence[float]],
@@ -717,7 +759,7 @@ def _visualize_layout(
     arch_y_arrow_spacing: float,
     show_shared_swaps: bool,
     layout_node_trace_index: int,
-    search_node_trace: go.Scatter | None,
+    search_node_trace: go.Scatter | go.Scattergl | None,
     plotly_settings: _PlotlySettings,
 ) -> None:
     layout = search_node.layout
@@ -832,12 +874,16 @@ def _load_layer_data(
     initial_positions = _reverse_layout(initial_layout)
     final_node_id = circuit_layer["final_node_id"]
 
-    graph, graph_root = _parse_search_graph(
-        f"{data_logging_path}nodes_layer_{layer}.csv", final_node_id, show_only_solution_path
+    nodes_file_path = f"{data_logging_path}nodes_layer_{layer}.csv"
+    graph, pos = _load_search_graph(
+        nodes_file_path,
+        Path(nodes_file_path).stat().st_mtime_ns,
+        final_node_id,
+        show_only_solution_path,
+        layout,
+        tapered_layer_heights,
     )
 
-    pos = _layout_search_graph(graph, graph_root, layout, tapered_layer_heights)
-
     (
         edge_x,
         edge_y,
@@ -1021,6 +1067,7 @@ def _visualize_search_graph_check_parameters(
     swap_arrow_spacing: float,
     swap_arrow_offset: float,
     use3d: bool,
+    use_webgl: bool,
     projection: Literal["orthographic", "perspective"],
     width: int,
     height: int,
@@ -1050,6 +1097,7 @@ def _visualize_search_graph_check_parameters(
     search_progression_step: int,
     search_progression_speed: float,
     plotly_settings: MutableMapping[str, MutableMapping[str, object]],
+    backend: Literal["plotly", "matplotlib"],
 ) -> tuple[
     str,  # data_logging_path
     bool,  # hide_layout
@@ -1076,6 +1124,13 @@ def _visualize_search_graph_check_parameters(
         msg = 'layer must be an integer or string literal "interactive"'  # type: ignore[unreachable]
         raise TypeError(msg)
 
+    if backend not in {"plotly", "matplotlib"}:
+        msg = 'backend must be either "plotly" or "matplotlib"'
+        raise TypeError(msg)
+    if backend == "matplotlib" and layer == "interactive":
+        msg = 'The matplotlib backend renders a static image and, hence, requires an integer layer instead of "interactive".'
+        raise ValueError(msg)
+
     if architecture_node_positions is not None:
         if not isinstance(architecture_node_positions, dict):
             msg = "architecture_node_positions must be a dict of the form {qubit_index: (x: float, y: float)}"
@@ -1132,6 +1187,10 @@ def _visualize_search_graph_check_parameters(
         msg = "use3d must be a boolean"  # type: ignore[unreachable]
         raise TypeError(msg)
 
+    if not isinstance(use_webgl, bool):
+        msg = "use_webgl must be a boolean"  # type: ignore[unreachable]
+        raise TypeError(msg)
+
     if projection not in {"orthographic", "perspective"}:
         msg = 'projection must be either "orthographic" or "perspective"'
         raise TypeError(msg)
@@ -1520,6 +1579,125 @@ def _visualize_search_graph_check_parameters(
     )
 
 
+def _visualize_search_graph_matplotlib(
+    data_logging_path: str,
+    layer: int,
+    architecture_node_positions: MutableMapping[int, Position] | None,
+    architecture_layout: Literal["dot", "neato", "fdp", "sfdp", "circo", "twopi", "osage", "patchwork"],
+    search_node_layout: Literal["walker", "dot", "neato", "fdp", "sfdp", "circo", "twopi", "osage", "patchwork"],
+    width: int,
+    height: int,
+    draw_search_edges: bool,
+    search_edges_width: float,
+    search_edges_color: str,
+    tapered_search_layer_heights: bool,
+    hide_layout: bool,
+    show_only_solution_path: bool,
+    color_valid_mapping: str | None,
+    color_final_node: str | None,
+    search_node_color: Sequence[str | Callable[[SearchNode], float]],
+    prioritize_search_node_color: Sequence[bool],
+    search_node_color_scale: Colorscale,
+    search_node_invert_color_scale: bool,
+) -> Widget:
+    """Render the search graph of a single layer as a static PNG image using matplotlib instead of Plotly."""
+    from io import BytesIO
+
+    from ipywidgets import Image
+    from matplotlib.figure import Figure
+
+    (
+        _,  # search_graph
+        _,  # initial_layout
+        initial_qbit_positions,
+        considered_qubit_colors,
+        _,  # single_qbit_multiplicities
+        _,  # two_qbit_multiplicities
+        _,  # individual_two_qbit_multiplicities
+        _,  # final_node_id
+        node_x,
+        node_y,
+        _,  # node_z
+        node_color,
+        _,  # stem_x
+        _,  # stem_y
+        _,  # stem_z
+        edge_x,
+        edge_y,
+        *_,  # edge_z, min_x, max_x, min_y, max_y, min_z, max_z
+    ) = _load_layer_data(
+        data_logging_path,
+        layer,
+        search_node_layout,
+        tapered_search_layer_heights,
+        1,
+        False,
+        search_node_color,
+        prioritize_search_node_color,
+        [],
+        color_valid_mapping,
+        color_final_node,
+        False,
+        draw_search_edges,
+        show_only_solution_path,
+    )
+
+    # data features are translated to colors the same way Plotly does it (min to max of the feature over all nodes)
+    node_colors: list[object] = list(node_color[0])
+    values = [c for c in node_color[0] if isinstance(c, (float, int))]
+    if values:
+        min_value = min(values)
+        value_range = max(values) - min_value
+        scale = ColorscaleValidator("search_node_color_scale", "visualize_search_graph").validate_coerce(
+            search_node_color_scale
+        )
+        if search_node_invert_color_scale:
+            scale = [[1 - p, c] for p, c in reversed(scale)]
+        colors = iter(
+            plotly.colors.sample_colorscale(
+                scale,
+                [(v - min_value) / value_range if value_range > 0 else 0.5 for v in values],
+                colortype="tuple",
+            )
+        )
+        node_colors = [next(colors) if isinstance(c, (float, int)) else c for c in node_color[0]]
+
+    fig = Figure(figsize=(width / 100, height / 100), dpi=100)
+    axes = fig.subplots(1, 1 if hide_layout else 2, squeeze=False)[0]
+    search_ax = axes[0]
+    if draw_search_edges:
+        search_ax.plot(edge_x, edge_y, color=search_edges_color, linewidth=search_edges_width, zorder=1)
+    search_ax.scatter(node_x, node_y, c=node_colors, s=25, zorder=2)
+    search_ax.set_axis_off()
+
+    if not hide_layout:
+        arch_ax = axes[1]
+        arch_file_path = f"{data_logging_path}architecture.json"
+        arch_graph = _parse_arch_graph(arch_file_path)
+        if architecture_node_positions is None:
+            architecture_node_positions = _layout_architecture(
+                arch_file_path, Path(arch_file_path).stat().st_mtime_ns, architecture_layout
+            )
+        for n0, n1 in arch_graph.edges():
+            (x0, y0), (x1, y1) = architecture_node_positions[n0], architecture_node_positions[n1]
+            arch_ax.plot([x0, x1], [y0, y1], color="#888", linewidth=1, zorder=1)
+        arch_x, arch_y = zip(*(architecture_node_positions[n] for n in arch_graph.nodes()))
+        arch_ax.scatter(arch_x, arch_y, c="#ddd", s=300, zorder=2)
+        for log_qubit, phys_qubit in enumerate(initial_qbit_positions):
+            if phys_qubit == -1 or log_qubit not in considered_qubit_colors:
+                continue
+            x, y = architecture_node_positions[phys_qubit]
+            arch_ax.scatter([x], [y], c=considered_qubit_colors[log_qubit], s=300, zorder=3)
+            arch_ax.annotate(f"q{log_qubit}", (x, y), ha="center", va="center", zorder=4)
+        arch_ax.set_axis_off()
+        arch_ax.set_aspect("equal", adjustable="datalim")
+
+    fig.tight_layout()
+    png = BytesIO()
+    fig.savefig(png, format="png")
+    return Image(value=png.getvalue(), format="png", width=width, height=height)
+
+
 def visualize_search_graph(
     data_logging_path: str,
     layer: int | Literal["interactive"] = "interactive",
@@ -1533,6 +1711,7 @@ def visualize_search_graph(
     swap_arrow_spacing: float = 0.05,
     swap_arrow_offset: float = 0.05,
     use3d: bool = True,
+    use_webgl: bool = True,
     projection: Literal["orthographic", "perspective"] = "perspective",
     width: int = 1400,
     height: int = 700,
@@ -1564,6 +1743,7 @@ def visualize_search_graph(
     search_progression_step: int = 10,
     search_progression_speed: float = 2,
     plotly_settings: MutableMapping[str, MutableMapping[str, object]] | None = None,
+    backend: Literal["plotly", "matplotlib"] = "plotly",
 ) -> Widget:
     """Creates a widget to visualize a search graph.
 
@@ -1578,6 +1758,7 @@ def visualize_search_graph(
         swap_arrow_spacing (float): Lateral spacing between arrows indicating swaps on the qubit connectivity graph. Defaults to 0.05.
         swap_arrow_offset (float): Offset of heads and shaft of swap arrows from qubits they are pointing to/from. Defaults to 0.05.
         use3d (bool): If a 3D graph should be used for the search graph using the z-axis to plot data features. Defaults to True.
+        use_webgl (bool): If the search nodes of a 2D search graph should be rendered with WebGL (plotly.graph_objects.Scattergl), which stays responsive for large search graphs. Defaults to True.
         projection (Literal['orthographic', 'perspective']): Projection type to use in 3D graphs. Defaults to "perspective".
         width (int): Pixel width of the widget. Defaults to 1400.
         height (int): Pixel height of the widget. Defaults to 700.
@@ -1606,6 +1787,7 @@ def visualize_search_graph(
         show_search_progression (bool): If the search progression should be animated. Defaults to True.
         search_progression_step (int): Step size (in number of nodes added) of search progression animation. Defaults to 10.
         search_progression_speed (float): Speed of the search progression animation in steps per second. Defaults to 2.
+        backend (Literal['plotly', 'matplotlib']): Library used to render the search graph. The matplotlib backend renders a static 2D image of the search graph (and the initial layout on the architecture) of a single layer, e.g., for headless environments. It neither requires a running Jupyter frontend nor supports the interactive options (3D, search progression, showing layouts and swaps, Plotly settings). Defaults to "plotly".
         plotly_settings (MutableMapping[str, MutableMapping[str, any]] | None): Plotly configuration dictionaries to be passed through. Defaults to None.
     .. code-block:: text
 
@@ -1659,6 +1841,7 @@ def visualize_search_graph(
         swap_arrow_spacing,
         swap_arrow_offset,
         use3d,
+        use_webgl,
         projection,
         width,
         height,
@@ -1688,6 +1871,7 @@ def visualize_search_graph(
         search_progression_step,
         search_progression_speed,
         plotly_settings,
+        backend,
     )
 
     # function-wide variables
@@ -1707,7 +1891,7 @@ def visualize_search_graph(
     arch_y_min: float | None = None
     arch_y_max: float | None = None
 
-    search_node_traces: Sequence[go.Scatter | go.Scatter3d] = []
+    search_node_traces: Sequence[go.Scatter | go.Scattergl | go.Scatter3d] = []
     search_edge_traces: Sequence[go.Scatter | go.Scatter3d] = []
     search_node_stem_trace: go.Scatter3d | None = None
     arch_node_trace: go.Scatter | None = None
@@ -1754,6 +1938,29 @@ def visualize_search_graph(
         msg = f"Invalid layer {layer}. There are only {number_of_layers} layers in the data log."
         raise ValueError(msg)
 
+    if backend == "matplotlib":
+        return _visualize_search_graph_matplotlib(
+            data_logging_path,
+            layer,  # type: ignore[arg-type]
+            architecture_node_positions,
+            architecture_layout,
+            search_node_layout,
+            width,
+            height,
+            draw_search_edges,
+            search_edges_width,
+            search_edges_color,
+            tapered_search_layer_heights,
+            hide_layout,
+            show_only_solution_path,
+            color_valid_mapping,
+            color_final_node,
+            search_node_color,
+            prioritize_search_node_color,
+            search_node_color_scale[0],
+            search_node_invert_color_scale[0],
+        )
+
     # prepare search graph traces
     search_node_traces, search_edge_traces, search_node_stem_trace = _prepare_search_graph_scatters(
         number_of_node_traces,
@@ -1762,6 +1969,7 @@ def visualize_search_graph(
         search_node_colorbar_title,
         search_node_colorbar_spacing,
         use3d,
+        use_webgl,
         draw_stems,
         draw_search_edges,
         full_plotly_settings,
@@ -1769,10 +1977,13 @@ def visualize_search_graph(
 
     # parse architecture info and prepare respective traces
     if not hide_layout:
-        arch_graph = _parse_arch_graph(f"{data_logging_path}architecture.json")
+        arch_file_path = f"{data_logging_path}architecture.json"
+        arch_graph = _parse_arch_graph(arch_file_path)
 
         if architecture_node_positions is None:
-            architecture_node_positions = graphviz_layout(arch_graph, prog=architecture_layout)
+            architecture_node_positions = _layout_architecture(
+                arch_file_path, Path(arch_file_path).stat().st_mtime_ns, architecture_layout
+            )
         elif len(architecture_node_positions) != len(arch_graph.nodes):
             msg = f"architecture_node_positions must contain positions for all {len(arch_graph.nodes)} architecture nodes."
             raise ValueError(msg)
@@ -59,6 +59,8 @@ MappingResults map(const py::object& circ, Architecture& arch,
     throw std::invalid_argument(ss.str());
   }
 
+  // the mapping itself does not touch any Python objects
+  const py::gil_scoped_release release;
   try {
     mapper->map(config);
   } catch (std::exception const& e) {
@@ -709,6 +711,7 @@ PYBIND11_MODULE(pyqmap, m) {
       "target state that starts in an initial state represented by a tableau.");
   synthesizer.def("synthesize", &cs::CliffordSynthesizer::synthesize,
                   "config"_a = cs::Configuration(),
+                  py::call_guard<py::gil_scoped_release>(),
                   "Runs the synthesis with the given configuration.");
   synthesizer.def_property_readonly("results",
                                     &cs::CliffordSynthesizer::getResults,
@@ -861,6 +864,7 @@ PYBIND11_MODULE(pyqmap, m) {
              na::InitialMapping initialMapping, bool verbose) {
             qc::QuantumComputation qc{};
             loadQC(qc, circ);
+            const py::gil_scoped_release release;
             mapper.mapAndConvert(qc, initialMapping, verbose);
           },
           "Map a quantum circuit to the neutral atom quantum computer",
@@ -874,7 +878,8 @@ PYBIND11_MODULE(pyqmap, m) {
             mapper.map(qc, initialMapping);
           },
           "Map a quantum circuit to the neutral atom quantum computer",
-          "filename"_a, "initial_mapping"_a = na::InitialMapping::Identity)
+          "filename"_a, "initial_mapping"_a = na::InitialMapping::Identity,
+          py::call_guard<py::gil_scoped_release>())
       .def("get_mapped_qc", &na::NeutralAtomMapper::getMappedQc,
            "Returns the mapped circuit as an extended qasm2 string")
       .def("save_mapped_qc", &na::NeutralAtomMapper::saveMappedQc,
@@ -891,6 +896,7 @@ PYBIND11_MODULE(pyqmap, m) {
           "schedule",
           [](na::NeutralAtomMapper& mapper, bool verbose,
              bool create_animation_csv, double shuttling_speed_factor) {
+            const py::gil_scoped_release release;
             auto results = mapper.schedule(verbose, create_animation_csv,
                                            shuttling_speed_factor);
             return results.toMap();
@@ -274,6 +274,24 @@ def test_synthesize_from_qiskit_pauli_list(bell_circuit: QuantumCircuit) -> None
     assert qcec.verify(circ, bell_circuit).considered_equivalent()
 
 
+def test_synthesize_from_modified_pauli_list(bell_circuit: QuantumCircuit) -> None:
+    """Test that a PauliList that is modified in between synthesis runs is not served from the cache."""
+    pauli_list = PauliList(["ZZ", "XX"])
+    qmap.synthesize_clifford(target_tableau=pauli_list)
+    pauli_list[0] = "XX"
+    pauli_list[1] = "ZZ"
+    circ, _ = qmap.synthesize_clifford(target_tableau=pauli_list)
+    assert qcec.verify(circ, bell_circuit).considered_equivalent()
+
+
+def test_synthesize_from_pauli_lists_of_different_lengths() -> None:
+    """Test that PauliLists of different lengths, which may reuse the id of a freed one, are not mixed up in the cache."""
+    for i in range(10):
+        labels = ["ZZ", "XX"] if i % 2 == 0 else ["ZZI", "IZZ", "XXX"]
+        circ, _ = qmap.synthesize_clifford(target_tableau=PauliList(labels))
+        assert circ.num_qubits == len(labels)
+
+
 def test_synthesize_from_string(bell_circuit: QuantumCircuit) -> None:
     """Test that we can synthesize a circuit from a String."""
     pauli_str = "[XX,ZZ]"
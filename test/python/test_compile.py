@@ -6,7 +6,7 @@ import locale
 from pathlib import Path
 
 import pytest
-from qiskit import QuantumCircuit
+from qiskit import QuantumCircuit, QuantumRegister
 
 from mqt.qcec import verify
 from mqt.qmap import (
@@ -22,6 +22,7 @@ from mqt.qmap import (
     SwapReduction,
     compile,
 )
+from mqt.qmap.compile import extract_initial_layout_from_qasm
 from mqt.qmap.visualization import SearchVisualizer
 
 
@@ -233,3 +234,14 @@ def test_parameters(example_circuit: QuantumCircuit) -> None:
     assert results.configuration.verbose is False
     assert results.configuration.debug is False
     assert not results.configuration.data_logging_path
+
+
+def test_extract_initial_layout_from_qasm() -> None:
+    """Test that the initial layout is extracted from the first layout comment of a QASM string."""
+    qreg = QuantumRegister(3, "q")
+    qasm = 'OPENQASM 3.0;\ninclude "stdgates.inc";\n// i 2 0 1\n// o 0 1 2\nqubit[3] q;\n'
+    layout = extract_initial_layout_from_qasm(qasm, [qreg])
+    assert [layout[qubit] for qubit in qreg] == [2, 0, 1]
+
+    with pytest.raises(ValueError, match="No initial layout found"):
+        extract_initial_layout_from_qasm("OPENQASM 3.0;\n// o 0 1 2\n", [qreg])
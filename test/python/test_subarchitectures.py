@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import contextlib
+import subprocess  # noqa: S404
+import sys
+from itertools import combinations
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 import pytest
 import rustworkx as rx
 from qiskit.providers.fake_provider import GenericBackendV2
@@ -129,6 +133,54 @@ def test_two_node_graph(singleton_graph: Graph) -> None:
     assert rx.is_isomorphic(order.optimal_candidates(1)[0], singleton_graph)
 
 
+def test_subarchitectures_cover_all_connected_subgraphs() -> None:
+    """Verify that every connected induced subgraph is represented by exactly one subarchitecture."""
+    cm = [(0, 1), (1, 2), (3, 4), (4, 5), (6, 7), (7, 8), (0, 3), (3, 6), (1, 4), (4, 7), (2, 5), (5, 8)]
+    order = SubarchitectureOrder.from_coupling_map(cm)
+
+    for n in range(1, order.arch.num_nodes() + 1):
+        for i, g in enumerate(order.sgs[n]):
+            assert rx.is_connected(g)
+            assert not any(rx.is_isomorphic(g, h) for h in order.sgs[n][i + 1 :])
+        for nodes in combinations(range(order.arch.num_nodes()), n):
+            sg = order.arch.subgraph(list(nodes))
+            if rx.is_connected(sg):
+                assert sum(rx.is_isomorphic(g, sg) for g in order.sgs[n]) == 1
+
+
+def test_subarchitecture_order_is_cached() -> None:
+    """Verify that cached partial orders are returned as independent copies."""
+    order = SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2), (2, 3)])
+    cached = SubarchitectureOrder.from_coupling_map([(3, 2), (0, 1), (2, 1)])
+    assert cached is not order
+    assert cached.subarch_order == order.subarch_order
+    assert not rx.is_isomorphic(SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2), (1, 3)]).arch, order.arch)
+
+    order.subarch_order.clear()
+    assert SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2), (2, 3)]).subarch_order == cached.subarch_order
+
+    SubarchitectureOrder.cache_clear()
+    assert SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2), (2, 3)]).subarch_order == cached.subarch_order
+
+
+def test_subarchitecture_order_jobs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify that the number of threads can be set via the MQT_QMAP_JOBS environment variable."""
+    monkeypatch.setenv("MQT_QMAP_JOBS", "1")
+    order = SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4)])
+    assert [len(sgs_n) for sgs_n in order.sgs] == [0, 1, 1, 2, 2, 1]
+
+    monkeypatch.setenv("MQT_QMAP_JOBS", "0")
+    with pytest.raises(ValueError, match="MQT_QMAP_JOBS must be a positive integer"):
+        SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 5)])
+
+
+def test_disconnected_architecture_opt() -> None:
+    """Verify that subarchitectures of different components of an architecture have no common optimal candidate."""
+    order = SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 6)])
+    assert order.optimal_candidates(3) == []
+    assert order.optimal_candidates(5) == []
+
+
 def test_ibm_guadalupe_opt(ibm_guadalupe: SubarchitectureOrder) -> None:
     """Verify optimal candidates for IBM Guadalupe architecture."""
     opt_cand_9 = ibm_guadalupe.optimal_candidates(9)
@@ -179,6 +231,17 @@ def test_rigetti16_opt_library_from_str(rigetti16_opt: Graph) -> None:
     assert rx.is_isomorphic(opt_cand, rigetti16_opt)
 
 
+def test_precomputed_library_is_not_shared() -> None:
+    """Verify that every load of a precomputed library returns an independent partial order."""
+    order = rigetti_16_subarchitectures()
+    loaded = SubarchitectureOrder.from_string("rigetti_16")
+    assert loaded is not order
+    assert loaded.subarch_order == order.subarch_order
+
+    order.desirable_subarchitectures.clear()
+    assert rigetti_16_subarchitectures().desirable_subarchitectures == loaded.desirable_subarchitectures
+
+
 def test_ibm_guadalupe_library() -> None:
     """Verify optimal candidates for IBM Guadalupe architecture from library."""
     opt_cand_9 = ibm_guadalupe_subarchitectures().optimal_candidates(9)
@@ -207,6 +270,40 @@ def test_store_subarch(ibm_guadalupe: SubarchitectureOrder) -> None:
         assert rx.is_isomorphic(opt_cand_load, opt_cand_orig)
 
 
+def test_store_subarch_compact(ibm_guadalupe: SubarchitectureOrder) -> None:
+    """Verify that subarchitecture order can be stored and loaded in the compact format."""
+    ibm_guadalupe.store_library("tmp", compact=True)
+
+    p = Path("tmp.npz")
+
+    loaded_tmp = SubarchitectureOrder.from_library(p)
+
+    if p.exists():
+        p.unlink()
+
+    assert loaded_tmp.subarch_order == ibm_guadalupe.subarch_order
+    assert loaded_tmp.desirable_subarchitectures == ibm_guadalupe.desirable_subarchitectures
+    assert loaded_tmp.isomorphisms.keys() == ibm_guadalupe.isomorphisms.keys()
+    for key, isos in ibm_guadalupe.isomorphisms.items():
+        assert loaded_tmp.isomorphisms[key].keys() == isos.keys()
+        assert all(np.array_equal(loaded_tmp.isomorphisms[key][e], iso) for e, iso in isos.items())
+    for n in range(1, ibm_guadalupe.arch.num_nodes() + 1):
+        opt_origin = ibm_guadalupe.optimal_candidates(n)
+        opt_loaded = loaded_tmp.optimal_candidates(n)
+        assert [g.nodes() for g in opt_loaded] == [g.nodes() for g in opt_origin]
+
+
+def test_store_subarch_compact_without_suffix(ibm_guadalupe: SubarchitectureOrder, tmp_path: Path) -> None:
+    """Verify that a compact library can be loaded without specifying its suffix."""
+    ibm_guadalupe.store_library(tmp_path / "tmp", compact=True)
+    assert (tmp_path / "tmp.npz").exists()
+
+    loaded_tmp = SubarchitectureOrder.from_library(tmp_path / "tmp")
+
+    assert loaded_tmp.subarch_order == ibm_guadalupe.subarch_order
+    assert loaded_tmp.desirable_subarchitectures == ibm_guadalupe.desirable_subarchitectures
+
+
 def test_subarchitecture_from_qmap_arch() -> None:
     """Verify that subarchitecture order can be created from QMAP architectures."""
     cm = {(0, 1), (1, 0), (1, 2), (2, 1)}
@@ -234,3 +331,14 @@ def test_invalid_opt_cand_arg(ibm_guadalupe: SubarchitectureOrder) -> None:
         match="Number of qubits must not be smaller or equal 0 or larger then number of physical qubits of architecture.",
     ):
         ibm_guadalupe.optimal_candidates(100)
+
+
+def test_subarchitectures_do_not_load_extension() -> None:
+    """Verify that enumerating subarchitectures neither loads the compiled extension nor the Z3 library."""
+    code = (
+        "import sys\n"
+        "from mqt.qmap.subarchitectures import SubarchitectureOrder\n"
+        "SubarchitectureOrder.from_coupling_map([(0, 1), (1, 2)])\n"
+        "assert 'mqt.qmap.pyqmap' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603